@@ -2,6 +2,12 @@ import streamlit as st
 from datetime import datetime
 from typing import Dict, List
 
+# Status choices in display order, with option -> selectbox index maps
+ACCOUNT_STATUSES = ("evaluation", "funded", "blown", "inactive")
+WITHDRAWAL_STATUSES = ("pending", "approved", "paid", "rejected")
+_ACCOUNT_STATUS_INDEX = {s: i for i, s in enumerate(ACCOUNT_STATUSES)}
+_WITHDRAWAL_STATUS_INDEX = {s: i for i, s in enumerate(WITHDRAWAL_STATUSES)}
+
 class ConfigManager:
     def __init__(self, data_storage):
         self.data_storage = data_storage
@@ -94,7 +100,7 @@ class ConfigManager:
                     selected_firm = st.selectbox("Prop Firm", firm_names)
                     
                     account_type = st.selectbox("Account Type", 
-                                               ["evaluation", "funded", "blown", "inactive"])
+                                               ACCOUNT_STATUSES)
                     account_size = st.selectbox("Account Size", 
                                                [25000, 50000, 100000, 150000, 200000, 250000, 300000])
                     account_number = st.text_input("Account Number/ID", placeholder="e.g., ACC-12345")
@@ -134,7 +140,7 @@ class ConfigManager:
             
             # Filter by status
             status_filter = st.selectbox("Filter by Status", 
-                                        ["All", "evaluation", "funded", "blown", "inactive"])
+                                        ("All",) + ACCOUNT_STATUSES)
             
             filtered_accounts = accounts if status_filter == "All" else \
                                [a for a in accounts if a.get('status') == status_filter]
@@ -164,8 +170,8 @@ class ConfigManager:
                     with col3:
                         # Quick actions
                         new_status = st.selectbox(f"Change Status", 
-                                                 ["evaluation", "funded", "blown", "inactive"],
-                                                 index=["evaluation", "funded", "blown", "inactive"].index(acc.get('status', 'evaluation')),
+                                                 ACCOUNT_STATUSES,
+                                                 index=_ACCOUNT_STATUS_INDEX.get(acc.get('status'), 0),
                                                  key=f"status_{i}")
                         
                         if new_status != acc.get('status'):
@@ -288,8 +294,7 @@ class ConfigManager:
                         st.write(f"**Exit:** {pb['exit_criteria']}")
                     
                     # Calculate performance from trades
-                    trades = self.data_storage.load_trades()
-                    pb_trades = [t for t in trades if t.get('playbook') == pb.get('name')]
+                    pb_trades = self.data_storage.get_trades_by_playbook(pb.get('name'))
                     
                     if pb_trades:
                         st.write("---")
@@ -339,7 +344,7 @@ class ConfigManager:
                         withdrawal_date = st.date_input("Withdrawal Date")
                     
                     with col2:
-                        status = st.selectbox("Status", ["pending", "approved", "paid", "rejected"])
+                        status = st.selectbox("Status", WITHDRAWAL_STATUSES)
                     
                     # Multi-allocation
                     st.write("**Allocation Breakdown:**")
@@ -395,15 +400,12 @@ class ConfigManager:
                             }
                             self.data_storage.add_withdrawal(withdrawal_data)
                             
-                            # Deduct from account balance
-                            all_accounts = self.data_storage.load_accounts()
-                            for i, acc in enumerate(all_accounts):
-                                if acc.get('account_number') == selected_acc.get('account_number'):
-                                    current_bal = acc.get('current_balance', acc.get('account_size', 0))
-                                    all_accounts[i]['current_balance'] = current_bal - amount
-                                    all_accounts[i]['updated_at'] = datetime.now().isoformat()
-                                    break
-                            self.data_storage.save_accounts(all_accounts)
+                            # Deduct from account balance. selected_acc is one of the records in
+                            # accounts, so it is updated in place rather than searched for again.
+                            current_bal = selected_acc.get('current_balance', selected_acc.get('account_size', 0))
+                            selected_acc['current_balance'] = current_bal - amount
+                            selected_acc['updated_at'] = datetime.now().isoformat()
+                            self.data_storage.save_accounts(accounts)
                             
                             st.success(f"Logged ${amount:.2f} withdrawal! Account balance updated.")
                             st.rerun()
@@ -412,9 +414,9 @@ class ConfigManager:
         if withdrawals:
             st.write("### Withdrawal History")
             
-            # Summary - handle both old and new format
-            total_withdrawn = sum(w.get('amount', 0) for w in withdrawals if w.get('status') == 'paid')
-            pending = sum(w.get('amount', 0) for w in withdrawals if w.get('status') == 'pending')
+            # Summary in one pass - handle both old and new format
+            total_withdrawn = 0
+            pending = 0
             
             # Calculate from allocations (new format) or allocation field (old format)
             reinvested = 0
@@ -423,8 +425,13 @@ class ConfigManager:
             personal = 0
             
             for w in withdrawals:
-                if w.get('status') != 'paid':
+                status = w.get('status')
+                if status == 'pending':
+                    pending += w.get('amount', 0)
+                    continue
+                if status != 'paid':
                     continue
+                total_withdrawn += w.get('amount', 0)
                     
                 if 'allocations' in w:
                     # New format
@@ -457,9 +464,10 @@ class ConfigManager:
             if pending > 0:
                 st.info(f"â³ Pending: ${pending:,.2f}")
             
-            # Withdrawal list
-            for i, w in enumerate(sorted(withdrawals, key=lambda x: x.get('date', ''), reverse=True)):
-                status_emoji = {"pending": "â³", "approved": "âœ…", "paid": "ðŸ’°", "rejected": "âŒ"}
+            # Withdrawal list, newest first; iterate positions so status updates hit the right record
+            status_emoji = {"pending": "â³", "approved": "âœ…", "paid": "ðŸ’°", "rejected": "âŒ"}
+            for i in sorted(range(len(withdrawals)), key=lambda j: withdrawals[j].get('date', ''), reverse=True):
+                w = withdrawals[i]
                 emoji = status_emoji.get(w.get('status', ''), "ðŸ“Š")
                 
                 with st.expander(f"{emoji} ${w.get('amount', 0):,.2f} - {w.get('prop_firm', 'Unknown')} ({w.get('date', 'N/A')})"):
@@ -492,8 +500,8 @@ class ConfigManager:
                     
                     # Update status
                     new_status = st.selectbox("Update Status", 
-                                             ["pending", "approved", "paid", "rejected"],
-                                             index=["pending", "approved", "paid", "rejected"].index(w.get('status', 'pending')),
+                                             WITHDRAWAL_STATUSES,
+                                             index=_WITHDRAWAL_STATUS_INDEX.get(w.get('status'), 0),
                                              key=f"w_status_{i}")
                     
                     if new_status != w.get('status'):
@@ -1,25 +1,29 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime, timedelta
+from datetime import date
 from typing import Dict, List
 
+from grade_display import GRADE_EMOJI
+
+@st.cache_data(ttl=60, max_entries=2, show_spinner=False)
+def _export_payload(_data_storage, data_dir: str, version) -> bytes:
+    """All data as JSON bytes for the export button, rebuilt only when a data file changes."""
+    return _data_storage.export_json()
+
 class Dashboard:
     def __init__(self, data_storage):
         self.data_storage = data_storage
     
     def show_performance_analysis(self):
-        trades = self.data_storage.load_trades()
-        accounts = self.data_storage.load_accounts()
-        withdrawals = self.data_storage.load_withdrawals()
-        checkins = self.data_storage.load_daily_checkins()
+        df = self.data_storage.load_trades_frame()
         
-        if not trades:
+        if df.empty:
             st.info("No trades logged yet. Start logging trades to see performance analysis.")
             return
         
-        df = pd.DataFrame(trades)
+        # plotly is only needed once there is something to chart
+        import plotly.graph_objects as go
+        
         df['date'] = pd.to_datetime(df['date'])
         
         # Date range filter
@@ -29,8 +33,9 @@ class Dashboard:
         with col2:
             end_date = st.date_input("To", value=df['date'].max().date())
         
-        # Filter data
-        mask = (df['date'].dt.date >= start_date) & (df['date'].dt.date <= end_date)
+        # Filter data - compare whole days as timestamps, not per-row date objects
+        day = df['date'].dt.normalize()
+        mask = (day >= pd.Timestamp(start_date)) & (day <= pd.Timestamp(end_date))
         filtered_df = df[mask]
         
         if filtered_df.empty:
@@ -42,9 +47,12 @@ class Dashboard:
         
         col1, col2, col3, col4, col5 = st.columns(5)
         
+        pnl = filtered_df['pnl_net']
+        is_win = pnl > 0
+        is_loss = pnl < 0
         total_trades = len(filtered_df)
-        winning_trades = len(filtered_df[filtered_df['pnl_net'] > 0])
-        losing_trades = len(filtered_df[filtered_df['pnl_net'] < 0])
+        winning_trades = int(is_win.sum())
+        losing_trades = int(is_loss.sum())
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
         
         with col1:
@@ -54,33 +62,38 @@ class Dashboard:
             st.metric("Win Rate", f"{win_rate:.1f}%")
         
         with col3:
-            total_pnl = filtered_df['pnl_net'].sum()
+            total_pnl = pnl.sum()
             st.metric("Total P&L", f"${total_pnl:,.2f}")
         
         with col4:
-            avg_win = filtered_df[filtered_df['pnl_net'] > 0]['pnl_net'].mean() if winning_trades > 0 else 0
+            avg_win = pnl[is_win].mean() if winning_trades > 0 else 0
             st.metric("Avg Win", f"${avg_win:,.2f}")
         
         with col5:
-            avg_loss = filtered_df[filtered_df['pnl_net'] < 0]['pnl_net'].mean() if losing_trades > 0 else 0
+            avg_loss = pnl[is_loss].mean() if losing_trades > 0 else 0
             st.metric("Avg Loss", f"${avg_loss:,.2f}")
         
         # Second row - Grade-based metrics
         st.subheader("📋 Performance by Grade")
         
         if 'grade' in filtered_df.columns:
+            # One groupby serves both the grade cards and the By Grade tab
+            grades = filtered_df['grade']
+            grade_stats = pnl.groupby(grades).agg(['count', 'sum', 'mean'])
+            grade_sizes = grades.value_counts()
+            grade_wins = is_win.groupby(grades).sum()
+            
             col1, col2, col3, col4 = st.columns(4)
             
             for i, (grade, col) in enumerate(zip(['A', 'B', 'C', 'F'], [col1, col2, col3, col4])):
-                grade_trades = filtered_df[filtered_df['grade'] == grade]
                 with col:
-                    grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}[grade]
+                    grade_emoji = GRADE_EMOJI[grade]
                     st.write(f"**{grade_emoji} {grade}-Grade**")
-                    if len(grade_trades) > 0:
-                        g_pnl = grade_trades['pnl_net'].sum()
-                        g_wins = (grade_trades['pnl_net'] > 0).sum()
-                        g_wr = g_wins / len(grade_trades) * 100
-                        st.metric("Trades", len(grade_trades))
+                    if grade in grade_sizes.index:
+                        g_count = int(grade_sizes[grade])
+                        g_pnl = grade_stats.at[grade, 'sum']
+                        g_wr = grade_wins[grade] / g_count * 100
+                        st.metric("Trades", g_count)
                         st.metric("P&L", f"${g_pnl:,.2f}")
                         st.metric("Win Rate", f"{g_wr:.0f}%")
                     else:
@@ -115,9 +128,7 @@ class Dashboard:
         with tab2:
             # Performance by grade
             if 'grade' in filtered_df.columns:
-                grade_stats = filtered_df.groupby('grade').agg({
-                    'pnl_net': ['count', 'sum', 'mean']
-                }).round(2)
+                grade_stats = grade_stats.round(2)
                 grade_stats.columns = ['Trades', 'Total P&L', 'Avg P&L']
                 
                 # Reorder
@@ -223,12 +234,10 @@ class Dashboard:
             )
         
         with col2:
-            all_data = self.data_storage.export_all_data()
-            import json
-            json_str = json.dumps(all_data, indent=2, default=str)
             st.download_button(
                 label="Download All Data JSON",
-                data=json_str,
-                file_name=f"trading_data_export_{datetime.now().strftime('%Y%m%d')}.json",
+                data=_export_payload(self.data_storage, self.data_storage.data_dir,
+                                     self.data_storage.data_version()),
+                file_name=f"trading_data_export_{date.today():%Y%m%d}.json",
                 mime="application/json"
             )
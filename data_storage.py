@@ -1,18 +1,98 @@
+import copy
 import json
+import mmap
 import os
-from typing import Dict, List, Any
-from datetime import datetime
+import shutil
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import partial
+from math import isfinite
+from numbers import Integral, Real
+from typing import Dict, List, Any, Optional
+from datetime import date, datetime
+
+try:
+    import orjson  # Optional: faster parsing, and reads mmapped files without copying
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    """Stdlib json fallback for non-native values: numpy scalars as numbers, anything else as str()."""
+    ndim = getattr(obj, 'ndim', None) if type(obj).__module__ == 'numpy' else None
+    if ndim == 0:
+        return obj.item()
+    if ndim is not None:
+        return obj.tolist()
+    return str(obj)
+
+def _all_finite(obj) -> bool:
+    """False if obj holds a NaN or infinite float anywhere; orjson would write it as null."""
+    t = type(obj)
+    if t is dict:
+        values = obj.values()
+    elif t is list or t is tuple:
+        values = obj
+    elif t.__module__ == 'numpy' and getattr(obj, 'ndim', 0):
+        return _all_finite(obj.tolist())
+    else:
+        return not isinstance(obj, Real) or isinstance(obj, Integral) or isfinite(obj)
+    for v in values:
+        t = type(v)
+        # The common JSON types are checked inline; only containers and others recurse
+        if t is str or t is int or t is bool or v is None:
+            continue
+        if t is float:
+            if not isfinite(v):
+                return False
+        elif not _all_finite(v):
+            return False
+    return True
+
+if orjson is not None:
+    # numpy values are written natively. Datetimes, dataclasses and subclasses of native
+    # types are passed through, and with no default they raise, so the stdlib writes them.
+    _ORJSON_OPTS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS)
+
+try:
+    import ijson  # Optional: streams very large trade files instead of loading them whole
+except ImportError:
+    ijson = None
+
+# Keys every saved settings record carries, with the value used when one is missing
+SETTING_DEFAULTS = {
+    'default_view': 'Overview',
+    'show_clearance_banner': True,
+    'enforce_clearance': 'Soft (Warning Only)',
+    'track_overrides': True,
+    'remind_checkin': True,
+    'end_of_day_summary': False,
+}
+
+# Files above this size are mmapped for parsing, and stream-filtered (when ijson
+# is available) for trade queries rather than parsed whole
+LARGE_FILE_BYTES = 2 * 1024 * 1024
 
 class DataStorage:
     """
     Handles all data persistence for the Trading Manager Pro application.
-    Uses JSON files for simple, human-readable storage.
+    Uses compact JSON files for simple storage; exports are pretty-printed.
     """
     
+    # The one error parse_json raises for invalid JSON, so callers need not import json
+    JSONDecodeError = json.JSONDecodeError
+    
     def __init__(self, data_dir: str = "trading_data"):
         self.data_dir = data_dir
         self.ensure_data_directory()
         
+        # Parsed file contents keyed by data type, invalidated on mtime/size change
+        self._cache = {}
+        
+        # Last issued numeric ID per data type, loaded lazily from counters.json
+        self.counters_file = os.path.join(self.data_dir, 'counters.json')
+        self._counters = None
+        
         # Define all data files
         self.data_files = {
             'prop_firms': 'prop_firms.json',
@@ -24,6 +104,15 @@ class DataStorage:
             'daily_entries': 'daily_entries.json',
             'config': 'config.json'
         }
+        self._paths = {data_type: os.path.join(self.data_dir, filename)
+                       for data_type, filename in self.data_files.items()}
+        
+        # One loader/saver per data type with its path already bound, so the
+        # load_*/save_* wrappers below skip the type check and path lookup
+        self._loaders = {data_type: partial(self._load_path, data_type, path)
+                         for data_type, path in self._paths.items()}
+        self._savers = {data_type: partial(self._save_path, data_type, path)
+                        for data_type, path in self._paths.items()}
         
         self.ensure_data_files()
     
@@ -34,37 +123,217 @@ class DataStorage:
     
     def ensure_data_files(self):
         """Create empty data files if they don't exist."""
+        existing = self._existing_files(self.data_dir)
         for data_type, filename in self.data_files.items():
-            filepath = os.path.join(self.data_dir, filename)
-            if not os.path.exists(filepath):
+            if filename not in existing:
                 self.save_data(data_type, [])
     
+    def _existing_files(self, directory: str) -> set:
+        """Names of the files in a directory, from a single directory scan."""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    
     def get_filepath(self, data_type: str) -> str:
         """Get the full filepath for a data type."""
-        if data_type not in self.data_files:
-            raise ValueError(f"Unknown data type: {data_type}")
-        return os.path.join(self.data_dir, self.data_files[data_type])
+        try:
+            return self._paths[data_type]
+        except KeyError:
+            raise ValueError(f"Unknown data type: {data_type}") from None
     
-    def load_data(self, data_type: str) -> List[Dict]:
-        """Load data from JSON file."""
-        filepath = self.get_filepath(data_type)
+    def _file_signature(self, filepath: str):
+        """Return (mtime_ns, size) for a file, or None if it is missing."""
         try:
-            with open(filepath, 'r') as f:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def file_version(self, data_type: str):
+        """
+        Cheap version stamp for a data file, (mtime_ns, size), or None if missing.
+        Changes whenever the file is written - handy as a cache key.
+        """
+        return self._file_signature(self.get_filepath(data_type))
+    
+    def data_version(self):
+        """Version stamp covering every data file; changes when any of them is written."""
+        return tuple(self._file_signature(path) for path in self._paths.values())
+    
+    def _read_json(self, filepath: str):
+        """Parse a JSON file, handing large files to orjson through mmap when available."""
+        with open(filepath, 'rb') as f:
+            if orjson is None:
+                return json.load(f)
+            try:
+                if os.fstat(f.fileno()).st_size <= LARGE_FILE_BYTES:
+                    return orjson.loads(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                # orjson is stricter (e.g. NaN); let the stdlib parser decide
+                f.seek(0)
                 return json.load(f)
+    
+    def parse_json(self, raw: bytes):
+        """
+        Parse JSON bytes (e.g. an uploaded backup), with orjson when available.
+        Invalid JSON raises DataStorage.JSONDecodeError whichever parser is used.
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # orjson is stricter (e.g. NaN); let the stdlib parser decide
+        return json.loads(raw)
+    
+    def _dump_json(self, data, indent: bool = False) -> bytes:
+        """
+        UTF-8 JSON bytes, compact unless indent. orjson writes payloads made of native types
+        (and numpy values); anything else goes to the stdlib encoder so values keep their old form.
+        """
+        # orjson writes NaN and infinities as null where json keeps them
+        if orjson is not None and _all_finite(data):
+            try:
+                return orjson.dumps(data, option=(_ORJSON_OPTS | orjson.OPT_INDENT_2) if indent else _ORJSON_OPTS)
+            except TypeError:
+                pass  # e.g. datetimes, non-string keys or huge ints
+        if indent:
+            return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8')
+    
+    def _load_cached(self, data_type: str, filepath: str = None) -> Dict:
+        """
+        Get the cache entry for a data type, re-reading the file only when it changed.
+        The entry's 'data' list is shared - callers must not mutate it.
+        """
+        if filepath is None:
+            filepath = self.get_filepath(data_type)
+        signature = self._file_signature(filepath)
+        entry = self._cache.get(data_type)
+        if entry is not None and entry['signature'] == signature:
+            return entry
+        
+        try:
+            data = self._read_json(filepath)
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            data = []
+        
+        entry = {'signature': signature, 'data': data}
+        self._cache[data_type] = entry
+        return entry
+    
+    def load_data(self, data_type: str) -> List[Dict]:
+        """Load data from JSON file."""
+        return self._load_path(data_type, self.get_filepath(data_type))
+    
+    def read_data(self, data_type: str) -> List[Dict]:
+        """
+        Records of a data type without copying them, for display-only callers.
+        Shared with the cache - use load_data() for records you can edit.
+        """
+        return self._load_cached(data_type)['data']
+    
+    def _load_path(self, data_type: str, filepath: str) -> List[Dict]:
+        """Load data for a data type whose filepath is already resolved."""
+        data = self._load_cached(data_type, filepath)['data']
+        if not isinstance(data, list):
+            return data
+        # Copy records so callers can edit them without touching the cache
+        return [dict(item) if isinstance(item, dict) else item for item in data]
     
     def save_data(self, data_type: str, data: List[Dict]) -> bool:
         """Save data to JSON file."""
-        filepath = self.get_filepath(data_type)
+        return self._save_path(data_type, self.get_filepath(data_type), data)
+    
+    def _save_path(self, data_type: str, filepath: str, data: List[Dict]) -> bool:
+        """Save data for a data type whose filepath is already resolved."""
+        self._cache.pop(data_type, None)
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(self._dump_json(data))
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
             return False
     
+    def _append_new_items(self, data_type: str, data: List[Dict]) -> bool:
+        """
+        Write only the items appended since the file was last read, in place of a full rewrite.
+        Applies when the cached list still matches the file and is an unchanged prefix
+        of data; returns False otherwise so the caller does a full save.
+        Only for callers that appended without editing existing records: loaded records
+        are shallow copies, so an edit to a nested list or dict inside one also changes
+        the cached record and the prefix check cannot see it.
+        """
+        entry = self._cache.get(data_type)
+        if entry is None or not isinstance(entry['data'], list):
+            return False
+        
+        saved = entry['data']
+        saved_len = len(saved)
+        filepath = self.get_filepath(data_type)
+        if not 0 < saved_len < len(data) or entry['signature'] != self._file_signature(filepath):
+            return False
+        if data[:saved_len] != saved:
+            return False
+        
+        tail = self._dump_json(data[saved_len:])[1:-1]
+        try:
+            with open(filepath, 'r+b') as f:
+                # Replace the closing bracket with the new items and a fresh bracket
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b']':
+                    return False
+                f.seek(-1, os.SEEK_END)
+                f.truncate()
+                f.write(b"," + tail + b"]")
+        except OSError as e:
+            print(f"Error appending data: {e}")
+            return False
+        
+        self._cache[data_type] = {
+            'signature': self._file_signature(filepath),
+            'data': saved + self.parse_json(b"[" + tail + b"]")
+        }
+        return True
+    
+    def next_id(self, data_type: str) -> int:
+        """
+        Get the next numeric ID for a data type.
+        IDs only ever go up, so deleting an item never frees its ID for reuse.
+        """
+        if self._counters is None:
+            try:
+                with open(self.counters_file, 'r') as f:
+                    self._counters = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._counters = {}
+        
+        if data_type not in self._counters:
+            # First ID for this type - continue from the highest one already stored
+            ids = [item.get('id') for item in self._load_cached(data_type)['data'] if isinstance(item, dict)]
+            self._counters[data_type] = max((i for i in ids if type(i) is int), default=0)
+        
+        self._counters[data_type] += 1
+        self._save_counters()
+        return self._counters[data_type]
+    
+    def _save_counters(self):
+        """Write the ID counters atomically so a crash can't leave a half-written file."""
+        tmp_path = self.counters_file + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._counters, f)
+            os.replace(tmp_path, self.counters_file)
+        except Exception as e:
+            print(f"Error saving counters: {e}")
+    
+    def _reset_counters(self):
+        """Forget issued IDs after bulk replacing data, so they are re-seeded from disk."""
+        self._counters = {}
+        self._save_counters()
+    
     def backup_all_data(self, backup_dir: str = None) -> str:
         """
         Create a backup of all data files.
@@ -76,27 +345,26 @@ class DataStorage:
         
         os.makedirs(backup_dir, exist_ok=True)
         
+        existing = self._existing_files(self.data_dir)
         for data_type, filename in self.data_files.items():
-            source = self.get_filepath(data_type)
+            source = self._paths[data_type]
             dest = os.path.join(backup_dir, filename)
             
-            if os.path.exists(source):
-                with open(source, 'r') as src_file:
-                    with open(dest, 'w') as dst_file:
-                        dst_file.write(src_file.read())
+            if filename in existing:
+                # copyfile lets the kernel copy the bytes (sendfile) without a trip through Python
+                shutil.copyfile(source, dest)
         
         return backup_dir
     
     def restore_from_backup(self, backup_dir: str) -> bool:
         """Restore data from a backup directory."""
         try:
+            existing = self._existing_files(backup_dir)
             for data_type, filename in self.data_files.items():
-                backup_file = os.path.join(backup_dir, filename)
-                if os.path.exists(backup_file):
-                    dest = self.get_filepath(data_type)
-                    with open(backup_file, 'r') as src:
-                        with open(dest, 'w') as dst:
-                            dst.write(src.read())
+                if filename in existing:
+                    shutil.copyfile(os.path.join(backup_dir, filename), self._paths[data_type])
+            self._cache.clear()
+            self._reset_counters()
             return True
         except Exception as e:
             print(f"Error restoring backup: {e}")
@@ -108,16 +376,16 @@ class DataStorage:
     
     def load_prop_firms(self) -> List[Dict]:
         """Load prop firms configuration."""
-        return self.load_data('prop_firms')
+        return self._loaders['prop_firms']()
     
     def save_prop_firms(self, firms: List[Dict]) -> bool:
         """Save prop firms configuration."""
-        return self.save_data('prop_firms', firms)
+        return self._savers['prop_firms'](firms)
     
     def add_prop_firm(self, firm: Dict) -> bool:
         """Add a new prop firm."""
         firms = self.load_prop_firms()
-        firm['id'] = len(firms) + 1
+        firm['id'] = self.next_id('prop_firms')
         firm['created_at'] = datetime.now().isoformat()
         firms.append(firm)
         return self.save_prop_firms(firms)
@@ -128,18 +396,19 @@ class DataStorage:
     
     def load_accounts(self) -> List[Dict]:
         """Load trading accounts."""
-        return self.load_data('accounts')
+        return self._loaders['accounts']()
     
     def save_accounts(self, accounts: List[Dict]) -> bool:
         """Save trading accounts."""
-        return self.save_data('accounts', accounts)
+        return self._savers['accounts'](accounts)
     
     def add_account(self, account: Dict) -> bool:
         """Add a new trading account."""
         accounts = self.load_accounts()
-        account['id'] = len(accounts) + 1
-        account['created_at'] = datetime.now().isoformat()
-        account['updated_at'] = datetime.now().isoformat()
+        account['id'] = self.next_id('accounts')
+        now_iso = datetime.now().isoformat()
+        account['created_at'] = now_iso
+        account['updated_at'] = now_iso
         accounts.append(account)
         return self.save_accounts(accounts)
     
@@ -164,16 +433,16 @@ class DataStorage:
     
     def load_playbooks(self) -> List[Dict]:
         """Load trading playbooks."""
-        return self.load_data('playbooks')
+        return self._loaders['playbooks']()
     
     def save_playbooks(self, playbooks: List[Dict]) -> bool:
         """Save trading playbooks."""
-        return self.save_data('playbooks', playbooks)
+        return self._savers['playbooks'](playbooks)
     
     def add_playbook(self, playbook: Dict) -> bool:
         """Add a new playbook."""
         playbooks = self.load_playbooks()
-        playbook['id'] = len(playbooks) + 1
+        playbook['id'] = self.next_id('playbooks')
         playbook['created_at'] = datetime.now().isoformat()
         playbooks.append(playbook)
         return self.save_playbooks(playbooks)
@@ -184,29 +453,163 @@ class DataStorage:
     
     def load_trades(self) -> List[Dict]:
         """Load trade journal entries."""
-        return self.load_data('trades')
+        return self._loaders['trades']()
     
-    def save_trades(self, trades: List[Dict]) -> bool:
-        """Save trade journal entries."""
-        return self.save_data('trades', trades)
+    def save_trades(self, trades: List[Dict], appended_only: bool = False) -> bool:
+        """
+        Save trade journal entries.
+        Pass appended_only=True when trades only gained new items since loading,
+        so just those are written; any edit to an existing trade needs a full save.
+        """
+        if appended_only and self._append_new_items('trades', trades):
+            return True
+        return self._savers['trades'](trades)
     
     def add_trade(self, trade: Dict) -> bool:
         """Add a new trade to the journal."""
         trades = self.load_trades()
-        trade['id'] = f"trade_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        trade['timestamp'] = datetime.now().isoformat()
+        now = datetime.now()
+        trade['id'] = f"trade_{now.strftime('%Y%m%d_%H%M%S')}"
+        trade['timestamp'] = now.isoformat()
         trades.append(trade)
-        return self.save_trades(trades)
+        return self.save_trades(trades, appended_only=True)
+    
+    def commit_trade(self, trade: Dict, account_number: str, pnl_net: float) -> bool:
+        """
+        Add a trade and apply its net P&L to the account it was taken on,
+        in one call with one timestamp. The trade is written first so a
+        failed balance update never loses the journal entry.
+        """
+        now = datetime.now()
+        now_iso = now.isoformat()
+        trade['id'] = f"trade_{now.strftime('%Y%m%d_%H%M%S')}"
+        trade['timestamp'] = now_iso
+        # The cached trades plus the new one: nothing is copied and only the tail is written
+        if not self.save_trades(self._load_cached('trades')['data'] + [trade], appended_only=True):
+            return False
+        
+        entry = self._load_cached('accounts')
+        by_number = entry.get('by_number')
+        if by_number is None:
+            by_number = {}
+            for i, a in enumerate(entry['data']):
+                # First record wins, as with a linear scan
+                by_number.setdefault(a.get('account_number'), i)
+            entry['by_number'] = by_number
+        i = by_number.get(account_number)
+        if i is None:
+            return True
+        # Copy only the record being changed; the others stay shared with the cache
+        accounts = list(entry['data'])
+        account = dict(accounts[i])
+        account['current_balance'] = account.get('current_balance', account.get('account_size', 0)) + pnl_net
+        account['updated_at'] = now_iso
+        accounts[i] = account
+        return self.save_accounts(accounts)
+    
+    def load_frame(self, data_type: str):
+        """
+        Get a data type as a pandas DataFrame, built once per file version.
+        Returns a copy, so callers may add or convert columns freely.
+        """
+        import pandas as pd
+        entry = self._load_cached(data_type)
+        frame = entry.get('frame')
+        if frame is None:
+            frame = pd.DataFrame(entry['data'])
+            entry['frame'] = frame
+        return frame.copy()
+    
+    def load_trades_frame(self):
+        """Get trades as a pandas DataFrame (see load_frame)."""
+        return self.load_frame('trades')
+    
+    def _trade_index(self):
+        """
+        Get the cached trades list with lookup indexes, built once per file version.
+        Indexes hold positions into the trades list.
+        """
+        entry = self._load_cached('trades')
+        trades = entry['data']
+        index = entry.get('index')
+        if index is None:
+            by_account = defaultdict(list)
+            by_grade = defaultdict(list)
+            by_playbook = defaultdict(list)
+            for i, t in enumerate(trades):
+                by_account[t.get('account_id')].append(i)
+                by_grade[t.get('grade')].append(i)
+                by_playbook[t.get('playbook')].append(i)
+            
+            date_order = sorted(range(len(trades)), key=lambda i: trades[i].get('date', ''))
+            index = {
+                'by_account': by_account,
+                'by_grade': by_grade,
+                'by_playbook': by_playbook,
+                'date_order': date_order,
+                'dates': [trades[i].get('date', '') for i in date_order],
+            }
+            entry['index'] = index
+        return trades, index
+    
+    def _should_stream(self, data_type: str) -> bool:
+        """Check whether a query should stream the file instead of loading it whole."""
+        if ijson is None:
+            return False
+        signature = self._file_signature(self.get_filepath(data_type))
+        if signature is None or signature[1] <= LARGE_FILE_BYTES:
+            return False
+        # Already parsed and cached - the indexes are cheaper than re-reading
+        entry = self._cache.get(data_type)
+        return entry is None or entry['signature'] != signature
+    
+    def _iter_trades_filtered(self, predicate):
+        """Stream trades from disk, yielding only those matching the predicate."""
+        try:
+            with open(self.get_filepath('trades'), 'rb') as f:
+                for t in ijson.items(f, 'item', use_float=True):
+                    if predicate(t):
+                        yield t
+        except (FileNotFoundError, ijson.JSONError):
+            return
     
     def get_trades_by_account(self, account_id: str) -> List[Dict]:
         """Get all trades for a specific account."""
-        trades = self.load_trades()
-        return [t for t in trades if t.get('account_id') == account_id]
+        if self._should_stream('trades'):
+            return list(self._iter_trades_filtered(lambda t: t.get('account_id') == account_id))
+        trades, index = self._trade_index()
+        return [dict(trades[i]) for i in index['by_account'].get(account_id, [])]
+    
+    def get_trades_by_grade(self, grade: str) -> List[Dict]:
+        """Get all trades with a specific grade."""
+        trades, index = self._trade_index()
+        return [dict(trades[i]) for i in index['by_grade'].get(grade, [])]
+    
+    def get_trades_by_playbook(self, playbook: str) -> List[Dict]:
+        """Get all trades for a specific playbook."""
+        trades, index = self._trade_index()
+        return [dict(trades[i]) for i in index['by_playbook'].get(playbook, [])]
     
     def get_trades_by_date_range(self, start_date: str, end_date: str) -> List[Dict]:
         """Get trades within a date range."""
-        trades = self.load_trades()
-        return [t for t in trades if start_date <= t.get('date', '') <= end_date]
+        if self._should_stream('trades'):
+            return list(self._iter_trades_filtered(lambda t: start_date <= t.get('date', '') <= end_date))
+        trades, index = self._trade_index()
+        dates = index['dates']
+        lo = bisect_left(dates, start_date)
+        hi = bisect_right(dates, end_date)
+        # Keep journal order, same as a full scan would
+        return [dict(trades[i]) for i in sorted(index['date_order'][lo:hi])]
+    
+    def get_trades_by_date(self, day: str) -> List[Dict]:
+        """Get trades on one day (YYYY-MM-DD); dates may carry a time after the day."""
+        if self._should_stream('trades'):
+            return list(self._iter_trades_filtered(lambda t: t.get('date', '')[:10] == day))
+        trades, index = self._trade_index()
+        dates = index['dates']
+        lo = bisect_left(dates, day)
+        hi = bisect_right(dates, day + '\uffff')
+        return [dict(trades[i]) for i in sorted(index['date_order'][lo:hi])]
     
     # ============================================
     # WITHDRAWALS
@@ -214,17 +617,18 @@ class DataStorage:
     
     def load_withdrawals(self) -> List[Dict]:
         """Load withdrawal records."""
-        return self.load_data('withdrawals')
+        return self._loaders['withdrawals']()
     
     def save_withdrawals(self, withdrawals: List[Dict]) -> bool:
         """Save withdrawal records."""
-        return self.save_data('withdrawals', withdrawals)
+        return self._savers['withdrawals'](withdrawals)
     
     def add_withdrawal(self, withdrawal: Dict) -> bool:
         """Add a new withdrawal record."""
         withdrawals = self.load_withdrawals()
-        withdrawal['id'] = f"withdrawal_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        withdrawal['timestamp'] = datetime.now().isoformat()
+        now = datetime.now()
+        withdrawal['id'] = f"withdrawal_{now.strftime('%Y%m%d_%H%M%S')}"
+        withdrawal['timestamp'] = now.isoformat()
         withdrawals.append(withdrawal)
         return self.save_withdrawals(withdrawals)
     
@@ -234,28 +638,40 @@ class DataStorage:
     
     def load_psychological_checkins(self) -> List[Dict]:
         """Load psychological check-in records."""
-        return self.load_data('psychological_checkins')
+        return self._loaders['psychological_checkins']()
     
     def save_psychological_checkins(self, checkins: List[Dict]) -> bool:
         """Save psychological check-in records."""
-        return self.save_data('psychological_checkins', checkins)
+        return self._savers['psychological_checkins'](checkins)
+    
+    def get_checkin_by_date(self, day: str) -> Optional[Dict]:
+        """
+        Get the check-in for a YYYY-MM-DD date, through a date index built once per file version.
+        Shared with the cache - callers must not mutate it.
+        """
+        entry = self._load_cached('psychological_checkins')
+        by_date = entry.get('by_date')
+        if by_date is None:
+            by_date = {}
+            for c in entry['data']:
+                # First record wins, as with a linear scan
+                by_date.setdefault(c.get('date'), c)
+            entry['by_date'] = by_date
+        return by_date.get(day)
     
     def load_daily_checkins(self) -> List[Dict]:
         """Load daily check-ins (kept for compatibility with old code)."""
-        # Try new format first, fall back to old
-        psych = self.load_psychological_checkins()
-        if psych:
-            return psych
-        return self.load_data('daily_checkins')
+        # Old daily check-ins now live in the psychological check-ins file
+        return self._loaders['psychological_checkins']()
     
     def save_daily_checkins(self, checkins: List[Dict]):
         """Save daily checkins (old format compatibility)."""
-        return self.save_data('daily_checkins', checkins)
+        return self._savers['psychological_checkins'](checkins)
     
     def add_daily_checkin(self, checkin: Dict):
         """Add checkin (old format compatibility)."""
         checkins = self.load_daily_checkins()
-        checkin['id'] = len(checkins) + 1
+        checkin['id'] = self.next_id('psychological_checkins')
         checkin['date'] = date.today().isoformat()
         checkin['timestamp'] = datetime.now().isoformat()
         checkins.append(checkin)
@@ -267,17 +683,18 @@ class DataStorage:
     
     def load_daily_entries(self) -> List[Dict]:
         """Load daily journal entries."""
-        return self.load_data('daily_entries')
+        return self._loaders['daily_entries']()
     
     def save_daily_entries(self, entries: List[Dict]) -> bool:
         """Save daily journal entries."""
-        return self.save_data('daily_entries', entries)
+        return self._savers['daily_entries'](entries)
     
     def add_daily_entry(self, entry: Dict) -> bool:
         """Add a new daily journal entry."""
         entries = self.load_daily_entries()
-        entry['id'] = f"entry_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        entry['timestamp'] = datetime.now().isoformat()
+        now = datetime.now()
+        entry['id'] = f"entry_{now.strftime('%Y%m%d_%H%M%S')}"
+        entry['timestamp'] = now.isoformat()
         entries.append(entry)
         return self.save_daily_entries(entries)
     
@@ -285,52 +702,81 @@ class DataStorage:
     # SETTINGS
     # ============================================
     
-    def load_settings(self) -> Dict:
-        """Load application settings."""
-        settings_data = self.load_data('config')
+    @property
+    def settings(self) -> Dict:
+        """
+        Current settings, re-read only when config.json changes.
+        Shared with the cache - use load_settings() for a copy you can edit.
+        """
+        settings_data = self._load_cached('config')['data']
         if settings_data and len(settings_data) > 0:
             return settings_data[0]
         return {}
     
-    def save_settings(self, settings: Dict) -> bool:
-        """Save application settings."""
-        # Ensure all expected keys exist with defaults
-        default_settings = {
-            'default_view': 'Overview',
-            'show_clearance_banner': True,
-            'enforce_clearance': 'Soft (Warning Only)',
-            'track_overrides': True,
-            'remind_checkin': True,
-            'end_of_day_summary': False,
-            'last_updated': datetime.now().isoformat()
-        }
+    def load_settings(self) -> Dict:
+        """Load application settings."""
+        return copy.deepcopy(self.settings)
+    
+    def save_settings(self, settings: Dict, timestamp: str = None) -> bool:
+        """Save application settings, stamped with timestamp (defaults to now)."""
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        
+        # Fill in missing keys with defaults, preserving extra fields like grade_rules
+        merged_settings = {**SETTING_DEFAULTS, **settings, 'last_updated': timestamp}
         
-        # Merge with existing settings (preserve extra fields like grade_rules, etc.)
-        merged_settings = {**default_settings, **settings}
-        merged_settings['last_updated'] = datetime.now().isoformat()
+        if not self.save_data('config', [merged_settings]):
+            return False
         
-        return self.save_data('config', [merged_settings])
+        # Keep the cache warm with what was just written
+        self._cache['config'] = {
+            'signature': self._file_signature(self.get_filepath('config')),
+            'data': [copy.deepcopy(merged_settings)]
+        }
+        return True
     
     # ============================================
     # IMPORT / EXPORT
     # ============================================
     
+    def counts(self, data_types=('trades', 'accounts', 'daily_entries', 'psychological_checkins')) -> Dict[str, int]:
+        """Record count per data type, taken from the load cache without copying records."""
+        return {data_type: len(self._load_cached(data_type)['data']) for data_type in data_types}
+    
     def export_all_data(self) -> Dict[str, List[Dict]]:
-        """Export all data as a dictionary for backup/download."""
+        """
+        Export all data as a dictionary for backup/download.
+        Sections are shared with the load cache, so treat the result as read-only.
+        """
         return {
-            'prop_firms': self.load_prop_firms(),
-            'accounts': self.load_accounts(),
-            'playbooks': self.load_playbooks(),
-            'trades': self.load_trades(),
-            'withdrawals': self.load_withdrawals(),
-            'psychological_checkins': self.load_psychological_checkins(),
-            'daily_entries': self.load_daily_entries(),
-            'settings': [self.load_settings()],
+            'prop_firms': self._load_cached('prop_firms')['data'],
+            'accounts': self._load_cached('accounts')['data'],
+            'playbooks': self._load_cached('playbooks')['data'],
+            'trades': self._load_cached('trades')['data'],
+            'withdrawals': self._load_cached('withdrawals')['data'],
+            'psychological_checkins': self._load_cached('psychological_checkins')['data'],
+            'daily_entries': self._load_cached('daily_entries')['data'],
+            'settings': [self.settings],
             'export_date': datetime.now().isoformat()
         }
     
+    def export_json(self, export_pretty: bool = True) -> bytes:
+        """All data as UTF-8 JSON bytes (indented unless export_pretty is False)."""
+        return self._dump_json(self.export_all_data(), indent=export_pretty)
+    
+    def export_to_file(self, filepath: str, export_pretty: bool = True) -> bool:
+        """Write all data to a single JSON file (indented unless export_pretty is False)."""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(self.export_json(export_pretty))
+            return True
+        except Exception as e:
+            print(f"Error exporting data: {e}")
+            return False
+    
     def import_all_data(self, data: Dict[str, List[Dict]]) -> bool:
         """Import data from a dictionary (from backup/upload)."""
+        now_iso = datetime.now().isoformat()
         try:
             if 'prop_firms' in data:
                 self.save_prop_firms(data['prop_firms'])
@@ -362,11 +808,12 @@ class DataStorage:
                 settings_data = data['settings']
                 # If it's a dict, save it directly
                 if isinstance(settings_data, dict):
-                    self.save_settings(settings_data)
+                    self.save_settings(settings_data, timestamp=now_iso)
                 # If it's a list with items, take the first one
                 elif isinstance(settings_data, list) and len(settings_data) > 0:
-                    self.save_settings(settings_data[0])
+                    self.save_settings(settings_data[0], timestamp=now_iso)
             
+            self._reset_counters()
             return True
         except Exception as e:
             print(f"Error importing data: {e}")
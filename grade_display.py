@@ -0,0 +1,5 @@
+"""Grade display constants shared by the grader, journal, dashboard and settings pages."""
+
+GRADE_EMOJI = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}
+COND_EMOJI = {"A": "🟢", "B": "🟡", "C": "🟠"}
+GRADE_COLORS = {"A": "green", "B": "orange", "C": "red", "F": "red"}
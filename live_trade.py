@@ -1,201 +1,258 @@
 import streamlit as st
-from datetime import datetime, date, time
+from datetime import date, time
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+from grade_display import GRADE_EMOJI, COND_EMOJI, GRADE_COLORS
+
+ACTIVE_STATUSES = frozenset({'evaluation', 'funded'})
+
+# Grade -> position-size banner renderer and icon; A (and anything else) is a success.
+# Plain st.* calls, so the banner lands in whichever container is active (the sidebar).
+_SIZE_BANNER = {"F": (st.error, "⛔"), "C": (st.warning, "⚠️"), "B": (st.info, "📊")}
+_SIZE_BANNER_DEFAULT = (st.success, "✅")
+
+# Safe defaults
+DEFAULT_SIZING = {
+    "A": {"drawdown_pct": 50, "label": "Full Size"},
+    "B": {"drawdown_pct": 30, "label": "Reduced"},
+    "C": {"drawdown_pct": 15, "label": "Minimum"},
+    "F": {"drawdown_pct": 0, "label": "NO TRADE"}
+}
+
+@lru_cache(maxsize=None)
+def _keys(prefix: str, n: int) -> Tuple[str, ...]:
+    """Keys prefix0 .. prefix{n-1}, built once per prefix and rule count."""
+    return tuple(f"{prefix}{i}" for i in range(n))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_settings_cached(_data_storage, data_dir: str, version) -> Tuple[Dict, int, int, Tuple[str, ...]]:
+    """
+    Settings keyed on the config file version, so reruns skip the disk read.
+    Also returns bitmasks of the conditions that unlock grade A and grade B,
+    and the A/B/C/F position size labels.
+    """
+    settings = _data_storage.load_settings()
+    conditions = settings.get('conditions', [])
+    sizing = settings.get('position_sizing', {})
+    a_mask = sum(1 << i for i, c in enumerate(conditions) if c.get('unlocks') == 'A')
+    b_mask = sum(1 << i for i, c in enumerate(conditions) if c.get('unlocks') == 'B')
+    size_labels = []
+    for grade in "ABCF":
+        size_info = sizing.get(grade, DEFAULT_SIZING[grade])
+        dd = size_info.get('drawdown_pct', 0)
+        lbl = size_info.get('label', 'NO TRADE' if grade == "F" else grade)
+        size_labels.append(f"{dd}% ({lbl})")
+    return settings, a_mask, b_mask, tuple(size_labels)
+
+@lru_cache(maxsize=256)
+def _grade(must_mask: int, must_full_mask: int, cond_mask: int,
+           a_mask: int, b_mask: int, size_labels: Tuple[str, ...]) -> Tuple[str, str]:
+    """Grade and size label for one checkbox state; size_labels is A, B, C, F."""
+    if (must_mask & must_full_mask) != must_full_mask:
+        return "F", size_labels[3]
+    # Highest grade unlocked by a checked condition, C if none
+    if cond_mask & a_mask:
+        return "A", size_labels[0]
+    if cond_mask & b_mask:
+        return "B", size_labels[1]
+    return "C", size_labels[2]
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _get_accounts(_data_storage, data_dir: str, version) -> List[Dict]:
+    """Accounts shared across reruns without pickling - treat as read-only."""
+    return _data_storage.load_accounts()
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _account_choices(_data_storage, data_dir: str, version) -> Tuple[List[Dict], List[str]]:
+    """Active accounts and their selectbox labels."""
+    accounts = _get_accounts(_data_storage, data_dir, version)
+    active_accounts = [a for a in accounts if a.get('status') in ACTIVE_STATUSES]
+    account_options = [f"{a.get('prop_firm', '?')} - ${a.get('account_size', 0):,} ({a.get('account_number', 'N/A')})" 
+                       for a in active_accounts]
+    return active_accounts, account_options
+
 class LiveTradeSession:
     def __init__(self, data_storage):
         self.data_storage = data_storage
     
-    def calculate_grade(self, must_have_checked: Dict[str, bool], 
-                       conditions_checked: Dict[str, bool]) -> Tuple[str, str]:
+    def load_grader_settings(self) -> Tuple[Dict, int, int, Tuple[str, ...]]:
+        """Get (settings, a_mask, b_mask, size_labels) through the rerun cache."""
+        return _load_settings_cached(self.data_storage, self.data_storage.data_dir,
+                                     self.data_storage.file_version('config'))
+    
+    def load_settings(self) -> Dict:
+        """Get settings through the rerun cache."""
+        return self.load_grader_settings()[0]
+    
+    def account_choices(self) -> Tuple[List[Dict], List[str]]:
+        """Get (active_accounts, account_options) through the rerun cache."""
+        return _account_choices(self.data_storage, self.data_storage.data_dir,
+                                self.data_storage.file_version('accounts'))
+    
+    def calculate_grade(self, must_mask: int, cond_mask: int) -> Tuple[str, str]:
         """
         Calculate grade based on checked conditions.
+        Bit i of must_mask / cond_mask is set when rule / condition i is checked.
         - All must-haves required or F
         - Highest unlocked grade from conditions wins
         - Default to C if must-haves met but no conditions
         """
-        settings = self.data_storage.load_settings()
-        must_have_rules = settings.get('must_have_rules', [])
-        conditions = settings.get('conditions', [])
-        sizing = settings.get('position_sizing', {})
-        
-        # Safe defaults
-        default_sizing = {
-            "A": {"drawdown_pct": 50, "label": "Full Size"},
-            "B": {"drawdown_pct": 30, "label": "Reduced"},
-            "C": {"drawdown_pct": 15, "label": "Minimum"},
-            "F": {"drawdown_pct": 0, "label": "NO TRADE"}
-        }
-        
-        # Check must-haves
-        if must_have_rules:
-            all_must_have = all(must_have_checked.get(f"must_{i}", False) 
-                               for i in range(len(must_have_rules)))
-            if not all_must_have:
-                f_info = sizing.get('F', default_sizing['F'])
-                dd = f_info.get('drawdown_pct', 0)
-                lbl = f_info.get('label', 'NO TRADE')
-                return "F", f"{dd}% ({lbl})"
-        
-        # Find highest grade from checked conditions
-        highest_grade = "C"  # Default if must-haves met
-        
-        for i, cond in enumerate(conditions):
-            if conditions_checked.get(f"cond_{i}", False):
-                unlocks = cond.get('unlocks', 'C')
-                if unlocks == "A":
-                    highest_grade = "A"
-                elif unlocks == "B" and highest_grade != "A":
-                    highest_grade = "B"
-        
-        size_info = sizing.get(highest_grade, default_sizing.get(highest_grade, {}))
-        dd = size_info.get('drawdown_pct', 0)
-        lbl = size_info.get('label', highest_grade)
-        size_label = f"{dd}% ({lbl})"
-        
-        return highest_grade, size_label
+        settings, a_mask, b_mask, size_labels = self.load_grader_settings()
+        must_full_mask = (1 << len(settings.get('must_have_rules', []))) - 1
+        return _grade(must_mask, must_full_mask, cond_mask, a_mask, b_mask, size_labels)
     
     def render_sidebar(self):
-        settings = self.data_storage.load_settings()
+        """Live grader; the caller opens `with st.sidebar:` (st.sidebar.* is not allowed inside a fragment)"""
+        settings = self.load_settings()
         must_have_rules = settings.get('must_have_rules', [])
         conditions = settings.get('conditions', [])
         
-        st.sidebar.markdown("---")
-        st.sidebar.header("🎯 Live Trade Grader")
+        st.markdown("---\n## 🎯 Live Trade Grader")
         
         if not must_have_rules and not conditions:
-            st.sidebar.warning("No rules configured. Go to **Settings > Grade Rules**")
+            st.warning("No rules configured. Go to **Settings > Grade Rules**")
             return
         
         # Init session state
         if 'live_active' not in st.session_state:
             st.session_state.live_active = False
-        if 'must_checked' not in st.session_state:
-            st.session_state.must_checked = {}
-        if 'cond_checked' not in st.session_state:
-            st.session_state.cond_checked = {}
+        if 'must_mask' not in st.session_state:
+            st.session_state.must_mask = 0
+        if 'cond_mask' not in st.session_state:
+            st.session_state.cond_mask = 0
         
         # Start/Clear
-        col1, col2 = st.sidebar.columns(2)
+        col1, col2 = st.columns(2)
         with col1:
             if st.button("🟢 Start", disabled=st.session_state.live_active):
                 st.session_state.live_active = True
-                st.session_state.must_checked = {f"must_{i}": False for i in range(len(must_have_rules))}
-                st.session_state.cond_checked = {f"cond_{i}": False for i in range(len(conditions))}
+                st.session_state.must_mask = 0
+                st.session_state.cond_mask = 0
                 st.rerun()
         with col2:
             if st.button("🔴 Clear", disabled=not st.session_state.live_active):
                 st.session_state.live_active = False
-                st.session_state.must_checked = {}
-                st.session_state.cond_checked = {}
+                st.session_state.must_mask = 0
+                st.session_state.cond_mask = 0
                 st.rerun()
         
         if not st.session_state.live_active:
-            st.sidebar.info("Click **Start** when stalking a setup")
+            st.info("Click **Start** when stalking a setup")
             return
         
-        # Must-haves
-        if must_have_rules:
-            st.sidebar.markdown("### 🔒 Must-Have")
-            for i, rule in enumerate(must_have_rules):
-                key = f"must_{i}"
-                st.session_state.must_checked[key] = st.sidebar.checkbox(
-                    rule, value=st.session_state.must_checked.get(key, False),
-                    key=f"live_must_{i}"
-                )
-        
-        # Conditions (unified list)
-        if conditions:
-            st.sidebar.markdown("### 📋 Conditions")
-            for i, cond in enumerate(conditions):
-                key = f"cond_{i}"
-                grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠"}.get(cond.get('unlocks', 'C'), "⚪")
-                label = f"{cond['condition']} [{grade_emoji}]"
-                st.session_state.cond_checked[key] = st.sidebar.checkbox(
-                    label, value=st.session_state.cond_checked.get(key, False),
-                    key=f"live_cond_{i}"
-                )
+        # Checkboxes live in one form so ticking several costs a single rerun
+        with st.form("live_grader", border=False):
+            # Must-haves
+            if must_have_rules:
+                st.markdown("### 🔒 Must-Have")
+                mask = st.session_state.must_mask
+                keys = _keys("live_must_", len(must_have_rules))
+                for i, rule in enumerate(must_have_rules):
+                    if st.checkbox(rule, value=bool((mask >> i) & 1), key=keys[i]):
+                        mask |= 1 << i
+                    else:
+                        mask &= ~(1 << i)
+                st.session_state.must_mask = mask
+            
+            # Conditions (unified list)
+            if conditions:
+                st.markdown("### 📋 Conditions")
+                mask = st.session_state.cond_mask
+                keys = _keys("live_cond_", len(conditions))
+                for i, cond in enumerate(conditions):
+                    grade_emoji = COND_EMOJI.get(cond.get('unlocks', 'C'), "⚪")
+                    label = f"{cond['condition']} [{grade_emoji}]"
+                    if st.checkbox(label, value=bool((mask >> i) & 1), key=keys[i]):
+                        mask |= 1 << i
+                    else:
+                        mask &= ~(1 << i)
+                st.session_state.cond_mask = mask
+            
+            st.form_submit_button("Update Grade")
         
         # Calculate grade
         grade, size_label = self.calculate_grade(
-            st.session_state.must_checked,
-            st.session_state.cond_checked
+            st.session_state.must_mask,
+            st.session_state.cond_mask
         )
         
-        st.sidebar.markdown("---")
-        
         # Grade display
-        grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}.get(grade, "⚪")
-        st.sidebar.markdown(f"## {grade_emoji} Grade: **{grade}**")
+        grade_emoji = GRADE_EMOJI.get(grade, "⚪")
+        st.markdown(f"---\n## {grade_emoji} Grade: **{grade}**")
         
         # Must-have status
         if must_have_rules:
-            must_count = sum(1 for v in st.session_state.must_checked.values() if v)
+            must_mask = st.session_state.must_mask
+            must_count = bin(must_mask & ((1 << len(must_have_rules)) - 1)).count("1")
             if must_count < len(must_have_rules):
-                st.sidebar.error(f"⚠️ Must-Have: {must_count}/{len(must_have_rules)}")
+                st.error(f"⚠️ Must-Have: {must_count}/{len(must_have_rules)}")
             else:
-                st.sidebar.success(f"✓ Must-Have: {must_count}/{len(must_have_rules)}")
+                st.success(f"✓ Must-Have: {must_count}/{len(must_have_rules)}")
         
         # Position sizing
-        st.sidebar.markdown("---")
-        if grade == "F":
-            st.sidebar.error(f"⛔ {size_label}")
-        elif grade == "C":
-            st.sidebar.warning(f"⚠️ {size_label}")
-        elif grade == "B":
-            st.sidebar.info(f"📊 {size_label}")
-        else:
-            st.sidebar.success(f"✅ {size_label}")
+        st.markdown("---")
+        render, icon = _SIZE_BANNER.get(grade, _SIZE_BANNER_DEFAULT)
+        render(f"{icon} {size_label}")
         
         # Log trade button
-        st.sidebar.markdown("---")
-        if st.sidebar.button("📝 Log This Trade", type="primary"):
+        st.markdown("---")
+        if st.button("📝 Log This Trade", type="primary"):
             st.session_state.show_trade_entry_form = True
             st.session_state.trade_entry_grade = grade
-            st.session_state.trade_entry_must = st.session_state.must_checked.copy()
-            st.session_state.trade_entry_cond = st.session_state.cond_checked.copy()
+            st.session_state.trade_entry_must_mask = st.session_state.must_mask
+            st.session_state.trade_entry_cond_mask = st.session_state.cond_mask
+            st.session_state.trade_entry_rules_md = self.rules_checked_markdown(
+                must_have_rules, conditions, st.session_state.must_mask, st.session_state.cond_mask
+            )
+            # The entry form renders in the main pane, outside the sidebar fragment
+            st.rerun()
+    
+    def rules_checked_markdown(self, must_have_rules: List[str], conditions: List[Dict],
+                             must_mask: int, cond_mask: int) -> Tuple[str, str]:
+        """Markdown for the must-have and condition columns of the Rules Checked expander."""
+        lines = ["**🔒 Must-Have:**"]
+        for i, rule in enumerate(must_have_rules):
+            icon = "✅" if (must_mask >> i) & 1 else "❌"
+            lines.append(f"{icon} {rule}")
+        must_md = "  \n".join(lines)
+        
+        lines = ["**📋 Conditions:**"]
+        for i, cond in enumerate(conditions):
+            icon = "✅" if (cond_mask >> i) & 1 else "⬜"
+            grade_emoji = COND_EMOJI.get(cond.get('unlocks', 'C'), "⚪")
+            lines.append(f"{icon} {cond['condition']} [{grade_emoji}]")
+        cond_md = "  \n".join(lines)
+        return must_md, cond_md
     
     def render_trade_entry_modal(self):
         if not st.session_state.get('show_trade_entry_form', False):
             return
         
-        settings = self.data_storage.load_settings()
-        accounts = self.data_storage.load_accounts()
+        settings = self.load_settings()
+        active_accounts, account_options = self.account_choices()
         must_have_rules = settings.get('must_have_rules', [])
         conditions = settings.get('conditions', [])
         
         st.header("📝 Log Trade")
         
         grade = st.session_state.get('trade_entry_grade', '?')
-        grade_colors = {"A": "green", "B": "orange", "C": "red", "F": "red"}
-        st.markdown(f"### Grade: :{grade_colors.get(grade, 'gray')}[**{grade}**]")
+        must_mask = st.session_state.get('trade_entry_must_mask', 0)
+        cond_mask = st.session_state.get('trade_entry_cond_mask', 0)
+        st.markdown(f"### Grade: :{GRADE_COLORS.get(grade, 'gray')}[**{grade}**]")
         
         # Show checked rules
         with st.expander("Rules Checked", expanded=False):
             col1, col2 = st.columns(2)
-            with col1:
-                st.write("**🔒 Must-Have:**")
-                must_checked = st.session_state.get('trade_entry_must', {})
-                for i, rule in enumerate(must_have_rules):
-                    icon = "✅" if must_checked.get(f"must_{i}", False) else "❌"
-                    st.write(f"{icon} {rule}")
-            
-            with col2:
-                st.write("**📋 Conditions:**")
-                cond_checked = st.session_state.get('trade_entry_cond', {})
-                for i, cond in enumerate(conditions):
-                    icon = "✅" if cond_checked.get(f"cond_{i}", False) else "⬜"
-                    grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠"}.get(cond.get('unlocks', 'C'), "⚪")
-                    st.write(f"{icon} {cond['condition']} [{grade_emoji}]")
+            must_md, cond_md = st.session_state.get('trade_entry_rules_md', ("", ""))
+            col1.markdown(must_md)
+            col2.markdown(cond_md)
         
         with st.form("trade_entry"):
             col1, col2 = st.columns(2)
             
             with col1:
-                active_accounts = [a for a in accounts if a.get('status') in ['evaluation', 'funded']]
                 if active_accounts:
-                    account_options = [f"{a.get('prop_firm', '?')} - ${a.get('account_size', 0):,} ({a.get('account_number', 'N/A')})" 
-                                      for a in active_accounts]
                     selected_account = st.selectbox("Account", account_options)
                 else:
                     st.warning("No active accounts")
@@ -257,8 +314,11 @@ class LiveTradeSession:
                     "pnl_net": pnl_net,
                     "commission": commission,
                     "grade": grade,
-                    "must_have_compliance": st.session_state.get('trade_entry_must', {}),
-                    "conditions_compliance": st.session_state.get('trade_entry_cond', {}),
+                    # Only checked keys are stored; a missing key means unchecked
+                    "must_have_compliance": {key: True for i, key in enumerate(_keys("must_", len(must_have_rules)))
+                                             if (must_mask >> i) & 1},
+                    "conditions_compliance": {key: True for i, key in enumerate(_keys("cond_", len(conditions)))
+                                              if (cond_mask >> i) & 1},
                     "emotional_state": emotional_state,
                     "would_repeat": would_repeat,
                     "followed_rules": grade in ["A", "B"],
@@ -267,22 +327,16 @@ class LiveTradeSession:
                     "was_planned": True,
                 }
                 
-                # Update account balance
-                all_accounts = self.data_storage.load_accounts()
-                for i, acc in enumerate(all_accounts):
-                    if acc.get('account_number') == selected_acc.get('account_number'):
-                        all_accounts[i]['current_balance'] = acc.get('current_balance', acc.get('account_size', 0)) + pnl_net
-                        all_accounts[i]['updated_at'] = datetime.now().isoformat()
-                        break
-                self.data_storage.save_accounts(all_accounts)
-                
-                self.data_storage.add_trade(trade_data)
+                # Journal the trade and update the account balance together
+                self.data_storage.commit_trade(trade_data, selected_acc.get('account_number'), pnl_net)
+                _get_accounts.clear()
+                _account_choices.clear()
                 
                 # Clear
                 st.session_state.show_trade_entry_form = False
                 st.session_state.live_active = False
-                st.session_state.must_checked = {}
-                st.session_state.cond_checked = {}
+                st.session_state.must_mask = 0
+                st.session_state.cond_mask = 0
                 
                 st.success(f"Logged! Grade: {grade}, P&L: ${pnl_net:+,.2f}")
                 st.balloons()
@@ -1,18 +1,17 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa  # installed with streamlit
 from datetime import datetime, date
-import json
-import os
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 from typing import Dict, List
 
-# Import custom modules
-from config_manager import ConfigManager
-from trade_journal import TradeJournal
-from dashboard import Dashboard
-from data_storage import DataStorage
+# Import custom modules. Storage and the live grader run on every page; the
+# page managers are imported by their get_* factories on first use.
+from data_storage import DataStorage, SETTING_DEFAULTS
+from grade_display import GRADE_EMOJI
 from live_trade import LiveTradeSession
-from settings_manager import SettingsManager
-from psychological_manager import PsychologicalManager
 
 # Page configuration
 st.set_page_config(
@@ -22,126 +21,281 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Clearance enforcement choices, as stored in settings
+ENFORCEMENT_LEVELS = ("Soft (Warning Only)", "Medium (Acknowledgment Required)", "Strict (Hard Block)")
+_ENFORCEMENT_INDEX = {level: i for i, level in enumerate(ENFORCEMENT_LEVELS)}
+
+# Clearance status -> banner renderer and icon (NO_CHECKIN shows no banner)
+_BANNER = {
+    'RED': (st.error, "🚫"),
+    'YELLOW': (st.warning, "⚠️"),
+    'GREEN': (st.success, "✅"),
+}
+
+# Arrow dtypes for the dashboard tables, so st.dataframe ships them without an object->Arrow pass
+_ARROW_FLOAT = pd.ArrowDtype(pa.float64())
+_ARROW_STRING = pd.ArrowDtype(pa.string())
+
+def _arrow_text(values) -> pd.Series:
+    """Arrow string column; non-text values (e.g. a numeric account number) are str()'d, None stays NA"""
+    return pd.Series([v if v is None or isinstance(v, str) else str(v) for v in values], dtype=_ARROW_STRING)
+
+def _arrow_float(values) -> pd.Series:
+    """Arrow float column, coerced through float64 so numeric strings convert as before"""
+    return pd.Series(values, dtype=float).astype(_ARROW_FLOAT)
+
+# Collections counted in the Restore from Backup preview (daily_checkins is the legacy check-in name)
+_RESTORE_PREVIEW_KEYS = ('trades', 'accounts', 'daily_entries', 'psychological_checkins', 'daily_checkins')
+
+# Recent Trades columns, in display order, with the value shown when a trade lacks one
+RECENT_TRADE_DEFAULTS = {
+    'date': 'N/A', 'grade': '-', 'symbol': 'N/A', 'direction': 'N/A', 'pnl_net': 0, 'emotional_state': '-'
+}
+_recent_trade_fields = itemgetter(*RECENT_TRADE_DEFAULTS)
+
+@st.cache_resource
 def get_data_storage():
-    """Get or create DataStorage instance"""
-    if 'data_storage' not in st.session_state or st.session_state.data_storage is None:
-        st.session_state.data_storage = DataStorage()
-    return st.session_state.data_storage
+    """Get the DataStorage instance shared by all sessions"""
+    return DataStorage()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_load(data_type: str, version) -> List[Dict]:
+    """Records of one data type, keyed on the file version so edits invalidate"""
+    return get_data_storage().load_data(data_type)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _recent_trades(version, count: int) -> List[Dict]:
+    """
+    Latest trades by date, newest first - a partial sort instead of sorting everything.
+    Each is filled with RECENT_TRADE_DEFAULTS so the display needs no .get defaults.
+    """
+    latest = nlargest(count, _cached_load('trades', version), key=lambda t: t.get('date', ''))
+    return [{**RECENT_TRADE_DEFAULTS, **t} for t in latest]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _withdrawal_totals(version) -> Dict[str, float]:
+    """Paid withdrawal total and debt paid, in one pass over the withdrawals"""
+    get = dict.get
+    total_withdrawn = 0
+    debt_paid = 0
+    for w in _cached_load('withdrawals', version):
+        if get(w, 'status') != 'paid':
+            continue
+        amount = get(w, 'amount', 0)
+        total_withdrawn += amount
+        # Debt tracking - handle both old and new format
+        allocations = get(w, 'allocations')
+        if allocations is not None:
+            debt_paid += allocations.get('debt', 0)
+        elif get(w, 'allocation') == 'Debt Payment':
+            debt_paid += amount
+    return {'total_withdrawn': total_withdrawn, 'debt_paid': debt_paid}
 
+def withdrawal_totals() -> Dict[str, float]:
+    """Get withdrawal totals through the rerun cache"""
+    return _withdrawal_totals(get_data_storage().file_version('withdrawals'))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _trading_clearance(version, today: str) -> Dict:
+    """Clearance status, recomputed only when check-ins change or the day rolls over"""
+    return get_psychological_manager().get_trading_clearance()
+
+def trading_clearance() -> Dict:
+    """Get today's trading clearance through the rerun cache"""
+    return _trading_clearance(get_data_storage().file_version('psychological_checkins'),
+                              date.today().isoformat())
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _account_overview(version):
+    """Account status counts and the Account Overview table, rebuilt only when accounts change"""
+    accounts = _cached_load('accounts', version)
+    status_counts = Counter()
+    if not accounts:
+        return status_counts, None
+    
+    # Build columns rather than row dicts, straight into Arrow dtypes.
+    # dict.get is bound once since the loop calls it six times per account.
+    get = dict.get
+    firms, numbers, sizes, balances, statuses, styles = [], [], [], [], [], []
+    for acc in accounts:
+        account_size = get(acc, 'account_size', 0)
+        status = get(acc, 'status', 'unknown')
+        status_counts[status] += 1
+        firms.append(get(acc, 'prop_firm', 'Unknown'))
+        numbers.append(get(acc, 'account_number', 'N/A'))
+        sizes.append(account_size)
+        balances.append(get(acc, 'current_balance', account_size))
+        statuses.append(status.capitalize())
+        styles.append(get(acc, 'account_style', 'Standard'))
+    
+    size_col = _arrow_float(sizes)
+    balance_col = _arrow_float(balances)
+    df_accounts = pd.DataFrame({
+        'Firm': _arrow_text(firms),
+        'Account': _arrow_text(numbers),
+        'Size': size_col,
+        'Balance': balance_col,
+        'P&L': balance_col - size_col,
+        'Status': _arrow_text(statuses),
+        'Style': _arrow_text(styles)
+    }, copy=False)
+    return status_counts, df_accounts
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _recent_trades_table(version) -> pd.DataFrame:
+    """Recent Trades table for the dashboard, rebuilt only when trades change"""
+    # Trades arrive normalized, so the columns are a straight projection
+    rows = list(map(_recent_trade_fields, _recent_trades(version, 10)))
+    df_trades = pd.DataFrame(rows, columns=['Date', 'Grade', 'Symbol', 'Direction', 'P&L', 'Emotional'])
+    if df_trades.empty:
+        return df_trades
+    grades = df_trades['Grade']
+    df_trades['Grade'] = grades.map(GRADE_EMOJI).fillna("⚪") + " " + grades.astype(str)
+    # Emotional mixes scores with '-', so it is left for Streamlit to coerce
+    for col in ('Date', 'Grade', 'Symbol', 'Direction'):
+        df_trades[col] = _arrow_text(df_trades[col])
+    df_trades['P&L'] = _arrow_float(df_trades['P&L'])
+    return df_trades
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _dashboard_metrics(version) -> Dict[str, str]:
+    """Dashboard quick stats, already formatted, computed once per trades version"""
+    # One fused pass: four accumulators instead of a pass per stat
+    trades = _cached_load('trades', version)
+    get = dict.get
+    total_pnl = a_pnl = f_pnl = 0
+    wins = 0
+    for t in trades:
+        p = get(t, 'pnl_net') or 0
+        total_pnl += p
+        if p > 0:
+            wins += 1
+        grade = get(t, 'grade')
+        if grade == 'A':
+            a_pnl += p
+        elif grade == 'F':
+            f_pnl += p
+    win_rate = (wins / len(trades) * 100) if trades else 0
+    return {
+        'total_pnl': f"${total_pnl:,.2f}",
+        'win_rate': f"{win_rate:.1f}%",
+        'a_pnl': f"${a_pnl:,.2f}",
+        'f_pnl': f"${f_pnl:,.2f}",
+    }
+
+@st.cache_data(ttl=60, max_entries=2, show_spinner=False)
+def _backup_payload(version) -> bytes:
+    """Full backup as JSON bytes, rebuilt only when a data file changes"""
+    return get_data_storage().export_json()
+
+@st.cache_resource
 def get_config_manager():
-    """Get or create ConfigManager instance"""
-    if 'config_manager' not in st.session_state or st.session_state.config_manager is None:
-        st.session_state.config_manager = ConfigManager(get_data_storage())
-    return st.session_state.config_manager
+    """Get the ConfigManager instance shared by all sessions"""
+    from config_manager import ConfigManager
+    return ConfigManager(get_data_storage())
 
+@st.cache_resource
 def get_trade_journal():
-    """Get or create TradeJournal instance"""
-    if 'trade_journal' not in st.session_state or st.session_state.trade_journal is None:
-        st.session_state.trade_journal = TradeJournal(get_data_storage())
-    return st.session_state.trade_journal
+    """Get the TradeJournal instance shared by all sessions"""
+    from trade_journal import TradeJournal
+    return TradeJournal(get_data_storage())
 
+@st.cache_resource
 def get_dashboard():
-    """Get or create Dashboard instance"""
-    if 'dashboard' not in st.session_state or st.session_state.dashboard is None:
-        st.session_state.dashboard = Dashboard(get_data_storage())
-    return st.session_state.dashboard
+    """Get the Dashboard instance shared by all sessions"""
+    from dashboard import Dashboard
+    return Dashboard(get_data_storage())
 
+@st.cache_resource
 def get_live_trade():
-    """Get or create LiveTradeSession instance"""
-    if 'live_trade' not in st.session_state or st.session_state.live_trade is None:
-        st.session_state.live_trade = LiveTradeSession(get_data_storage())
-    return st.session_state.live_trade
+    """Get the LiveTradeSession instance shared by all sessions (its state lives in session_state)"""
+    return LiveTradeSession(get_data_storage())
 
+@st.cache_resource
 def get_settings_manager():
-    """Get or create SettingsManager instance"""
-    if 'settings_manager' not in st.session_state or st.session_state.settings_manager is None:
-        st.session_state.settings_manager = SettingsManager(get_data_storage())
-    return st.session_state.settings_manager
+    """Get the SettingsManager instance shared by all sessions"""
+    from settings_manager import SettingsManager
+    return SettingsManager(get_data_storage())
 
+@st.cache_resource
 def get_psychological_manager():
-    """Get or create PsychologicalManager instance"""
-    if 'psychological_manager' not in st.session_state or st.session_state.psychological_manager is None:
-        st.session_state.psychological_manager = PsychologicalManager(get_data_storage())
-    return st.session_state.psychological_manager
+    """Get the PsychologicalManager instance shared by all sessions"""
+    from psychological_manager import PsychologicalManager
+    return PsychologicalManager(get_data_storage())
+
+def _open_special_page(page=None):
+    """
+    Button callback: show a special page, or main navigation when page is None.
+    Callbacks run before the rerun the click triggers, so no st.rerun() is needed.
+    """
+    st.session_state.special_page = page
 
 def main():
+    ss = st.session_state
+    
     # Sidebar navigation
     st.sidebar.title("📈 Trading Manager")
     
     # Add Daily Discipline section at top
     with st.sidebar.expander("🧠 Daily Discipline", expanded=False):
-        col1, col2 = st.sidebar.columns(2)
+        # st.columns, not st.sidebar.columns, so the buttons land inside the expander
+        col1, col2 = st.columns(2)
         with col1:
-            if st.button("📝 Check-In", use_container_width=True, key="psych_checkin"):
-                st.session_state.special_page = "Daily Check-In"
-                st.rerun()
+            st.button("📝 Check-In", use_container_width=True, key="psych_checkin",
+                      on_click=_open_special_page, args=("Daily Check-In",))
         with col2:
-            if st.button("🚦 Status", use_container_width=True, key="psych_status"):
-                st.session_state.special_page = "Trading Clearance"
-                st.rerun()
+            st.button("🚦 Status", use_container_width=True, key="psych_status",
+                      on_click=_open_special_page, args=("Trading Clearance",))
     
     st.sidebar.markdown("---")
     
     # Check if on special page
-    if 'special_page' in st.session_state and st.session_state.special_page:
+    special = ss.get('special_page')
+    if special:
         # Show back button
-        if st.sidebar.button("⬅️ Back to Main", use_container_width=True, type="primary"):
-            st.session_state.special_page = None
-            st.rerun()
+        st.sidebar.button("⬅️ Back to Main", use_container_width=True, type="primary",
+                          on_click=_open_special_page)
         
         # Render special page
-        if st.session_state.special_page == "Daily Check-In":
-            show_daily_checkin()
-            return
-        elif st.session_state.special_page == "Trading Clearance":
-            show_clearance_status()
+        special_page = _SPECIAL_PAGES.get(special)
+        if special_page is not None:
+            special_page()
             return
     
     # Regular navigation
-    page = st.sidebar.selectbox(
-        "Navigate",
-        ["📊 Dashboard", "⚙️ Configuration", "📓 Trade Journal", "📈 Performance", "🔧 Settings", "💾 Backup"]
-    )
+    page = st.sidebar.selectbox("Navigate", _PAGE_NAMES)
     
     # Show clearance status banner (optional, can be toggled in settings)
-    settings = get_data_storage().load_settings()
-    if settings.get('show_clearance_banner', True):
-        clearance = get_psychological_manager().get_trading_clearance()
-        if clearance['status'] == 'RED':
-            st.error(f"🚫 {clearance['message']}")
-        elif clearance['status'] == 'YELLOW':
-            st.warning(f"⚠️ {clearance['message']}")
-        elif clearance['status'] == 'GREEN':
-            st.success(f"✅ {clearance['message']}")
+    settings = get_data_storage().settings
+    if settings.get('show_clearance_banner', SETTING_DEFAULTS['show_clearance_banner']):
+        clearance = trading_clearance()
+        banner = _BANNER.get(clearance['status'])
+        if banner is not None:
+            show_banner, icon = banner
+            show_banner(f"{icon} {clearance['message']}")
     
     # Render live trade grader in sidebar (YOUR ORIGINAL FEATURE)
-    get_live_trade().render_sidebar()
+    with st.sidebar:
+        show_live_grader()
     
     # Check if we need to show the trade entry modal
-    if st.session_state.get('show_trade_entry_form', False):
+    if ss.get('show_trade_entry_form', False):
         get_live_trade().render_trade_entry_modal()
     else:
-        # Main content based on selection
-        if page == "📊 Dashboard":
-            show_dashboard()
-        elif page == "⚙️ Configuration":
-            show_configuration()
-        elif page == "📓 Trade Journal":
-            show_trade_journal()
-        elif page == "📈 Performance":
-            show_performance_analysis()
-        elif page == "🔧 Settings":
-            show_settings()
-        elif page == "💾 Backup":
-            show_backup()
+        # Main content based on selection. Each page is a fragment, so its own
+        # widgets rerun just the page rather than the sidebar and banner too.
+        _PAGES[page]()
+
+@st.fragment
+def show_live_grader():
+    """Sidebar grader as a fragment - updating the grade doesn't rerun the page"""
+    get_live_trade().render_sidebar()
 
 def show_daily_checkin():
     """NEW - Daily psychological check-in"""
     col1, col2 = st.columns([1, 6])
     with col1:
-        if st.button("⬅️ Back", use_container_width=True):
-            st.session_state.special_page = None
-            st.rerun()
+        st.button("⬅️ Back", use_container_width=True, on_click=_open_special_page)
     
     get_psychological_manager().show_daily_checkin_form()
 
@@ -149,158 +303,127 @@ def show_clearance_status():
     """NEW - Trading clearance dashboard"""
     col1, col2 = st.columns([1, 6])
     with col1:
-        if st.button("⬅️ Back", use_container_width=True):
-            st.session_state.special_page = None
-            st.rerun()
+        st.button("⬅️ Back", use_container_width=True, on_click=_open_special_page)
     
-    get_psychological_manager().show_clearance_dashboard()
+    get_psychological_manager().show_clearance_dashboard(trading_clearance())
+
+def _frac_pct(amount: float, target: float):
+    """Progress toward target as (fraction capped at 1.0, percent); zero when there is no target"""
+    frac = amount / target if target > 0 else 0.0
+    if frac > 1.0:
+        frac = 1.0
+    return frac, frac * 100
 
+@st.fragment
 def show_dashboard():
     st.title("🎯 Trading Manager Pro")
     
     data_storage = get_data_storage()
-    settings = data_storage.load_settings()
-    accounts = data_storage.load_accounts()
-    trades = data_storage.load_trades()
-    withdrawals = data_storage.load_withdrawals()
+    settings = data_storage.settings
+    trades_version = data_storage.file_version('trades')
+    status_counts, df_accounts = _account_overview(data_storage.file_version('accounts'))
+    totals = withdrawal_totals()
     
     # Goal tracking row
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_withdrawn = sum(w['amount'] for w in withdrawals if w.get('status') == 'paid')
+        total_withdrawn = totals['total_withdrawn']
         goal = settings.get('goal_amount', 1000000)
-        progress = min(total_withdrawn / goal * 100, 100) if goal > 0 else 0
+        frac, pct = _frac_pct(total_withdrawn, goal)
         st.metric("Total Withdrawn", f"${total_withdrawn:,.2f}")
-        st.progress(progress / 100)
-        st.caption(f"{progress:.2f}% to ${goal:,.0f}")
+        st.progress(frac)
+        st.caption(f"{pct:.2f}% to ${goal:,.0f}")
     
     with col2:
-        funded_accounts = [acc for acc in accounts if acc.get('status') == 'funded']
-        st.metric("Funded Accounts", len(funded_accounts))
+        st.metric("Funded Accounts", status_counts['funded'])
     
     with col3:
-        eval_accounts = [acc for acc in accounts if acc.get('status') == 'evaluation']
-        st.metric("Evaluation Accounts", len(eval_accounts))
+        st.metric("Evaluation Accounts", status_counts['evaluation'])
     
     with col4:
-        # Debt tracking - handle both old and new format
         debt_amount = settings.get('debt_amount', 5000)
-        debt_paid = 0
-        for w in withdrawals:
-            if w.get('status') != 'paid':
-                continue
-            if 'allocations' in w:
-                debt_paid += w['allocations'].get('debt', 0)
-            elif w.get('allocation') == 'Debt Payment':
-                debt_paid += w.get('amount', 0)
-        
+        debt_paid = totals['debt_paid']
         debt_remaining = max(0, debt_amount - debt_paid)
         st.metric(f"{settings.get('debt_name', 'Debt')} Left", f"${debt_remaining:,.2f}")
         if debt_amount > 0:
-            st.progress(min(debt_paid / debt_amount, 1.0))
+            st.progress(_frac_pct(debt_paid, debt_amount)[0])
     
     # Account overview
     st.subheader("📋 Account Overview")
-    if accounts:
-        account_data = []
-        for acc in accounts:
-            account_size = acc.get('account_size', 0)
-            current_balance = acc.get('current_balance', account_size)
-            pnl = current_balance - account_size
-            account_data.append({
-                'Firm': acc.get('prop_firm', 'Unknown'),
-                'Account': acc.get('account_number', 'N/A'),
-                'Size': f"${account_size:,}",
-                'Balance': f"${current_balance:,.2f}",
-                'P&L': f"${pnl:+,.2f}",
-                'Status': acc.get('status', 'unknown').capitalize(),
-                'Style': acc.get('account_style', 'Standard')
-            })
-        
-        df_accounts = pd.DataFrame(account_data)
-        st.dataframe(df_accounts, use_container_width=True, hide_index=True)
+    if df_accounts is not None:
+        # Money columns are numeric; the frontend formats them
+        st.dataframe(df_accounts, use_container_width=True, hide_index=True, column_config={
+            'Size': st.column_config.NumberColumn(format="$%,.0f"),
+            'Balance': st.column_config.NumberColumn(format="$%,.2f"),
+            'P&L': st.column_config.NumberColumn(format="$%+,.2f"),
+        })
     else:
         st.info("No accounts configured. Go to Configuration to add your accounts.")
     
     # Recent trades with grades
     st.subheader("📓 Recent Trades")
-    if trades:
-        recent_trades = sorted(trades, key=lambda x: x.get('date', ''), reverse=True)[:10]
-        trade_data = []
-        for t in recent_trades:
-            grade = t.get('grade', '-')
-            grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}.get(grade, "⚪")
-            trade_data.append({
-                'Date': t.get('date', 'N/A'),
-                'Grade': f"{grade_emoji} {grade}",
-                'Symbol': t.get('symbol', 'N/A'),
-                'Direction': t.get('direction', 'N/A'),
-                'P&L': f"${t.get('pnl_net', 0):+,.2f}",
-                'Emotional': t.get('emotional_state', '-'),
-            })
-        df_trades = pd.DataFrame(trade_data)
-        st.dataframe(df_trades, use_container_width=True, hide_index=True)
+    df_trades = _recent_trades_table(trades_version)
+    if not df_trades.empty:
+        # P&L stays numeric (sorts correctly); the frontend formats it
+        st.dataframe(df_trades, use_container_width=True, hide_index=True,
+                     column_config={'P&L': st.column_config.NumberColumn(format="$%+,.2f")})
         
         # Quick stats
+        metrics = _dashboard_metrics(trades_version)
         col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            total_pnl = sum(t.get('pnl_net', 0) for t in trades)
-            st.metric("Total P&L", f"${total_pnl:,.2f}")
-        with col2:
-            wins = sum(1 for t in trades if t.get('pnl_net', 0) > 0)
-            win_rate = (wins / len(trades) * 100) if trades else 0
-            st.metric("Win Rate", f"{win_rate:.1f}%")
-        with col3:
-            a_trades = [t for t in trades if t.get('grade') == 'A']
-            a_pnl = sum(t.get('pnl_net', 0) for t in a_trades)
-            st.metric("A-Grade P&L", f"${a_pnl:,.2f}")
-        with col4:
-            f_trades = [t for t in trades if t.get('grade') == 'F']
-            f_pnl = sum(t.get('pnl_net', 0) for t in f_trades)
-            st.metric("F-Grade P&L", f"${f_pnl:,.2f}")
+        col1.metric("Total P&L", metrics['total_pnl'])
+        col2.metric("Win Rate", metrics['win_rate'])
+        col3.metric("A-Grade P&L", metrics['a_pnl'])
+        col4.metric("F-Grade P&L", metrics['f_pnl'])
     else:
         st.info("No trades logged yet. Use the Live Trade Grader in the sidebar!")
 
+@st.fragment
 def show_configuration():
     st.header("⚙️ Configuration")
     
+    config_manager = get_config_manager()
     tab1, tab2, tab3, tab4 = st.tabs(["Prop Firms", "Accounts", "Playbooks", "Withdrawals"])
     
     with tab1:
-        get_config_manager().manage_prop_firms()
+        config_manager.manage_prop_firms()
     
     with tab2:
-        get_config_manager().manage_accounts()
+        config_manager.manage_accounts()
     
     with tab3:
-        get_config_manager().manage_playbooks()
+        config_manager.manage_playbooks()
     
     with tab4:
-        get_config_manager().manage_withdrawals()
+        config_manager.manage_withdrawals()
 
+@st.fragment
 def show_trade_journal():
     st.header("📓 Trade Journal")
     get_trade_journal().show_journal()
 
+@st.fragment
 def show_performance_analysis():
     st.header("📈 Performance Analysis")
     get_dashboard().show_performance_analysis()
 
+@st.fragment
 def show_settings():
     """UPDATED - Merged settings"""
     st.header("🔧 Settings")
     
+    settings_manager = get_settings_manager()
     tab1, tab2, tab3, tab4 = st.tabs(["💰 Financial", "📋 Grade Rules", "📊 Position Sizing", "🧠 Discipline"])
     
     with tab1:
-        get_settings_manager().manage_financial_settings()
+        settings_manager.manage_financial_settings()
     
     with tab2:
-        get_settings_manager().manage_grade_rules()
+        settings_manager.manage_grade_rules()
     
     with tab3:
-        get_settings_manager().manage_position_sizing()
+        settings_manager.manage_position_sizing()
     
     with tab4:
         # NEW - Psychological settings
@@ -311,28 +434,27 @@ def show_discipline_settings():
     st.subheader("🧠 Trading Discipline Settings")
     
     data_storage = get_data_storage()
-    settings = data_storage.load_settings()
+    # Read-only view for the widget defaults; a copy is taken only to save
+    settings = data_storage.settings
     
     with st.form("discipline_settings"):
         st.markdown("**Clearance System**")
         
         show_banner = st.checkbox(
             "Show clearance status banner on all pages",
-            value=settings.get('show_clearance_banner', True)
+            value=settings.get('show_clearance_banner', SETTING_DEFAULTS['show_clearance_banner'])
         )
         
         enforcement = st.selectbox(
             "Clearance Enforcement Level",
-            ["Soft (Warning Only)", "Medium (Acknowledgment Required)", "Strict (Hard Block)"],
-            index=["Soft (Warning Only)", "Medium (Acknowledgment Required)", "Strict (Hard Block)"].index(
-                settings.get('enforce_clearance', 'Soft (Warning Only)')
-            ),
+            ENFORCEMENT_LEVELS,
+            index=_ENFORCEMENT_INDEX.get(settings.get('enforce_clearance', SETTING_DEFAULTS['enforce_clearance']), 0),
             help="How strictly to enforce psychological clearance requirements"
         )
         
         track_overrides = st.checkbox(
             "Track when I override clearance warnings",
-            value=settings.get('track_overrides', True)
+            value=settings.get('track_overrides', SETTING_DEFAULTS['track_overrides'])
         )
         
         st.markdown("---")
@@ -347,6 +469,7 @@ def show_discipline_settings():
                                         value=settings.get('max_stress_level', 7))
         
         if st.form_submit_button("💾 Save Discipline Settings", type="primary"):
+            settings = data_storage.load_settings()
             settings['show_clearance_banner'] = show_banner
             settings['enforce_clearance'] = enforcement
             settings['track_overrides'] = track_overrides
@@ -356,6 +479,7 @@ def show_discipline_settings():
             st.success("✅ Discipline settings saved!")
             st.rerun()
 
+@st.fragment
 def show_backup():
     st.header("💾 Backup & Restore")
     
@@ -372,25 +496,33 @@ def show_backup():
     # DOWNLOAD BACKUP
     st.subheader("⬇️ Download Backup")
     
-    all_data = data_storage.export_all_data()
-    json_str = json.dumps(all_data, indent=2, default=str)
+    version = data_storage.data_version()
+    counts = data_storage.counts()
     
     # Show summary
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Trades", len(all_data.get('trades', [])))
-    col2.metric("Accounts", len(all_data.get('accounts', [])))
-    col3.metric("Daily Entries", len(all_data.get('daily_entries', [])))
-    col4.metric("Check-ins", len(all_data.get('psychological_checkins', [])))
-    
-    filename = f"trading_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    
-    st.download_button(
-        label="📥 Download Full Backup",
-        data=json_str,
-        file_name=filename,
-        mime="application/json",
-        type="primary"
-    )
+    col1.metric("Trades", counts['trades'])
+    col2.metric("Accounts", counts['accounts'])
+    col3.metric("Daily Entries", counts['daily_entries'])
+    col4.metric("Check-ins", counts['psychological_checkins'])
+    
+    # Serializing everything is the expensive part, so only do it on request.
+    # A backup prepared before the data changed is not offered for download.
+    # The filename is stamped with the time the backup was prepared, not each render.
+    if st.button("📦 Prepare Backup"):
+        st.session_state.backup_version = version
+        st.session_state.backup_filename = f"trading_backup_{datetime.now():%Y%m%d_%H%M%S}.json"
+    
+    if st.session_state.get('backup_version') == version:
+        st.download_button(
+            label="📥 Download Full Backup",
+            data=_backup_payload(version),
+            file_name=st.session_state.backup_filename,
+            mime="application/json",
+            type="primary"
+        )
+    else:
+        st.caption("Prepare a backup of the current data to download it.")
     
     st.markdown("---")
     
@@ -403,18 +535,26 @@ def show_backup():
     
     if uploaded_file is not None:
         try:
-            backup_data = json.loads(uploaded_file.read().decode('utf-8'))
+            # Parse once per upload; ticking the confirm box reruns this fragment
+            parsed = st.session_state.get('restore_upload')
+            if parsed is None or parsed[0] != uploaded_file.file_id:
+                parsed = (uploaded_file.file_id, data_storage.parse_json(uploaded_file.getvalue()))
+                st.session_state.restore_upload = parsed
+            backup_data = parsed[1]
             
             # Show what's in the backup
+            counts = {k: len(backup_data.get(k) or ()) for k in _RESTORE_PREVIEW_KEYS}
             st.write("**Backup contents:**")
             col1, col2, col3, col4 = st.columns(4)
-            col1.write(f"Trades: {len(backup_data.get('trades', []))}")
-            col2.write(f"Accounts: {len(backup_data.get('accounts', []))}")
-            col3.write(f"Daily Entries: {len(backup_data.get('daily_entries', []))}")
-            col4.write(f"Check-ins: {len(backup_data.get('psychological_checkins', []) or backup_data.get('daily_checkins', []))}")
+            col1.write(f"Trades: {counts['trades']}")
+            col2.write(f"Accounts: {counts['accounts']}")
+            col3.write(f"Daily Entries: {counts['daily_entries']}")
+            col4.write(f"Check-ins: {counts['psychological_checkins'] or counts['daily_checkins']}")
             
-            if backup_data.get('exported_at'):
-                st.write(f"Backup date: {backup_data['exported_at']}")
+            # Exports stamp export_date; older backups used exported_at
+            backup_date = backup_data.get('export_date') or backup_data.get('exported_at')
+            if backup_date:
+                st.write(f"Backup date: {backup_date}")
             
             # Confirm restore
             confirm = st.checkbox("I understand this will overwrite all current data")
@@ -426,10 +566,12 @@ def show_backup():
                     st.balloons()
                     st.rerun()
         
-        except json.JSONDecodeError:
+        except DataStorage.JSONDecodeError:
             st.error("Invalid JSON file")
         except Exception as e:
             st.error(f"Error: {str(e)}")
+    else:
+        st.session_state.pop('restore_upload', None)
     
     st.markdown("---")
     
@@ -442,5 +584,22 @@ def show_backup():
     - Backup filename includes date/time for easy tracking
     """)
 
+# Navigation label -> page renderer, in sidebar order
+_PAGES = {
+    "📊 Dashboard": show_dashboard,
+    "⚙️ Configuration": show_configuration,
+    "📓 Trade Journal": show_trade_journal,
+    "📈 Performance": show_performance_analysis,
+    "🔧 Settings": show_settings,
+    "💾 Backup": show_backup,
+}
+# Navigation options, built once rather than listed from _PAGES on every run
+_PAGE_NAMES = tuple(_PAGES)
+
+_SPECIAL_PAGES = {
+    "Daily Check-In": show_daily_checkin,
+    "Trading Clearance": show_clearance_status,
+}
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
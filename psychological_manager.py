@@ -1,8 +1,65 @@
 import streamlit as st
 import pandas as pd
+from collections import Counter
 from datetime import datetime, date, timedelta
-import json
-from typing import Dict, Optional, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Optional, List, Tuple
+
+# Fixed scoring rules shared by _risk_core and PsychologicalManager.risk_levels
+SLEEP_OPTIMAL = 7  # Fewer hours than this is a yellow flag
+STRESS_MODERATE = 5  # Stress at or above this is a yellow flag
+YELLOW_LIMIT = 2  # This many yellow flags (and no red) makes the day YELLOW
+
+# _risk_core's threshold arguments, pulled from risk_thresholds in one C-level call
+_threshold_values = itemgetter('sleep_min', 'stress_max', 'emotional_max', 'home_stress_max')
+
+@lru_cache(maxsize=512, typed=True)
+def _risk_core(sleep_min, stress_max, emotional_max, home_stress_max,
+               alcohol, sleep, stress, emotion, home_stress, exercise) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Risk level and flags for one check-in's values, memoized since the same check-ins
+    are scored for the banner, the pattern analysis and the history table.
+    Flags are tuples so the shared cached result can't be modified. The cache is typed
+    because the flag text shows values as given, so 6 and 6.0 need separate entries.
+    """
+    red_flags = []
+    yellow_flags = []
+    
+    # Critical red flags (immediate trading ban)
+    if alcohol:
+        red_flags.append("Alcohol consumed in last 24hrs")
+    
+    if sleep < sleep_min:
+        red_flags.append(f"Insufficient sleep ({sleep}hrs < {sleep_min}hrs)")
+    
+    if stress > stress_max:
+        red_flags.append(f"Stress level too high ({stress}/10)")
+    
+    if emotion > emotional_max:
+        red_flags.append(f"Emotional state too high ({emotion}/10)")
+    
+    # Yellow flags (proceed with extreme caution)
+    if sleep < SLEEP_OPTIMAL:
+        yellow_flags.append(f"Below optimal sleep ({sleep}hrs)")
+    
+    if home_stress > home_stress_max:
+        yellow_flags.append(f"High home stress ({home_stress}/10)")
+    
+    if not exercise:
+        yellow_flags.append("No exercise/movement today")
+    
+    if stress >= STRESS_MODERATE:
+        yellow_flags.append(f"Moderate stress level ({stress}/10)")
+    
+    # Determine final risk level
+    if red_flags:
+        level = 'RED'
+    elif len(yellow_flags) >= YELLOW_LIMIT:
+        level = 'YELLOW'
+    else:
+        level = 'GREEN'
+    return level, tuple(red_flags), tuple(yellow_flags)
 
 class PsychologicalManager:
     """
@@ -20,67 +77,63 @@ class PsychologicalManager:
         }
     
     def get_todays_checkin(self) -> Optional[Dict]:
-        """Get today's psychological check-in if it exists."""
-        checkins = self.data_storage.load_data('psychological_checkins')
-        today = date.today().isoformat()
-        return next((c for c in checkins if c['date'] == today), None)
+        """Get today's psychological check-in if it exists (shared with the cache - read only)."""
+        return self.data_storage.get_checkin_by_date(date.today().isoformat())
     
     def save_checkin(self, checkin_data: Dict) -> bool:
         """Save a daily psychological check-in."""
-        checkins = self.data_storage.load_data('psychological_checkins')
+        # Records are only filtered into a new list, never edited, so no copies are needed
+        checkins = self.data_storage.read_data('psychological_checkins')
         today = date.today().isoformat()
         
-        # Remove any existing check-in for today
-        checkins = [c for c in checkins if c['date'] != today]
+        # Remove any existing check-in for today; the date index says whether there is one
+        if self.data_storage.get_checkin_by_date(today) is not None:
+            checkins = [c for c in checkins if c['date'] != today]
         
         # Add new check-in
         checkin_data['date'] = today
         checkin_data['timestamp'] = datetime.now().isoformat()
-        checkins.append(checkin_data)
+        checkins = checkins + [checkin_data]
         
         return self.data_storage.save_data('psychological_checkins', checkins)
     
-    def calculate_risk_level(self, checkin: Dict) -> str:
+    def calculate_risk_level(self, checkin: Dict) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
         """
         Calculate trading risk level based on psychological state.
-        Returns: 'GREEN', 'YELLOW', or 'RED'
+        Returns: (level, red flags, yellow flags), level being 'GREEN', 'YELLOW' or 'RED'
         """
-        red_flags = []
-        yellow_flags = []
-        
-        # Critical red flags (immediate trading ban)
-        if checkin.get('alcohol_consumed', False):
-            red_flags.append("Alcohol consumed in last 24hrs")
-        
-        if checkin.get('sleep_hours', 0) < self.risk_thresholds['sleep_min']:
-            red_flags.append(f"Insufficient sleep ({checkin.get('sleep_hours', 0)}hrs < {self.risk_thresholds['sleep_min']}hrs)")
-        
-        if checkin.get('stress_level', 0) > self.risk_thresholds['stress_max']:
-            red_flags.append(f"Stress level too high ({checkin.get('stress_level', 0)}/10)")
-        
-        if checkin.get('emotional_state', 0) > self.risk_thresholds['emotional_max']:
-            red_flags.append(f"Emotional state too high ({checkin.get('emotional_state', 0)}/10)")
-        
-        # Yellow flags (proceed with extreme caution)
-        if checkin.get('sleep_hours', 0) < 7:
-            yellow_flags.append(f"Below optimal sleep ({checkin.get('sleep_hours', 0)}hrs)")
-        
-        if checkin.get('home_stress', 0) > self.risk_thresholds['home_stress_max']:
-            yellow_flags.append(f"High home stress ({checkin.get('home_stress', 0)}/10)")
-        
-        if not checkin.get('exercise_done', False):
-            yellow_flags.append("No exercise/movement today")
-        
-        if checkin.get('stress_level', 0) >= 5:
-            yellow_flags.append(f"Moderate stress level ({checkin.get('stress_level', 0)}/10)")
-        
-        # Determine final risk level
-        if red_flags:
-            return 'RED', red_flags, yellow_flags
-        elif len(yellow_flags) >= 2:
-            return 'YELLOW', red_flags, yellow_flags
-        else:
-            return 'GREEN', red_flags, yellow_flags
+        get = checkin.get
+        return _risk_core(
+            *_threshold_values(self.risk_thresholds),
+            get('alcohol_consumed', False), get('sleep_hours', 0), get('stress_level', 0),
+            get('emotional_state', 0), get('home_stress', 0), get('exercise_done', False)
+        )
+    
+    def risk_levels(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Risk level of every check-in row, with the same rules as calculate_risk_level
+        but as column comparisons instead of one call per row.
+        """
+        t = self.risk_thresholds
+        
+        def col(name, default):
+            return df[name] if name in df else pd.Series(default, index=df.index)
+        
+        # Truthiness matches the dict version: a missing (NaN) value counts as True
+        alcohol = col('alcohol_consumed', False).astype(bool)
+        exercise = col('exercise_done', False).astype(bool)
+        sleep = col('sleep_hours', 0)
+        stress = col('stress_level', 0)
+        
+        red = (alcohol | (sleep < t['sleep_min']) | (stress > t['stress_max'])
+               | (col('emotional_state', 0) > t['emotional_max']))
+        yellow_count = ((sleep < SLEEP_OPTIMAL).astype(int) + (col('home_stress', 0) > t['home_stress_max']).astype(int)
+                        + (~exercise).astype(int) + (stress >= STRESS_MODERATE).astype(int))
+        
+        levels = pd.Series('GREEN', index=df.index)
+        levels[yellow_count >= YELLOW_LIMIT] = 'YELLOW'
+        levels[red] = 'RED'
+        return levels
     
     def get_trading_clearance(self) -> Dict:
         """
@@ -132,7 +185,7 @@ class PsychologicalManager:
     
     def get_recent_pattern_analysis(self, days: int = 7) -> Dict:
         """Analyze psychological patterns over recent days."""
-        checkins = self.data_storage.load_data('psychological_checkins')
+        checkins = self.data_storage.read_data('psychological_checkins')
         
         # Get last N days
         cutoff_date = (date.today() - timedelta(days=days)).isoformat()
@@ -142,27 +195,30 @@ class PsychologicalManager:
         if not recent:
             return {'days_analyzed': 0}
         
-        # Calculate averages
-        avg_sleep = sum(c.get('sleep_hours', 0) for c in recent) / len(recent)
-        avg_stress = sum(c.get('stress_level', 0) for c in recent) / len(recent)
-        avg_emotional = sum(c.get('emotional_state', 0) for c in recent) / len(recent)
-        
-        # Count flags
-        red_days = sum(1 for c in recent if self.calculate_risk_level(c)[0] == 'RED')
-        yellow_days = sum(1 for c in recent if self.calculate_risk_level(c)[0] == 'YELLOW')
-        green_days = sum(1 for c in recent if self.calculate_risk_level(c)[0] == 'GREEN')
-        
-        alcohol_days = sum(1 for c in recent if c.get('alcohol_consumed', False))
-        exercise_days = sum(1 for c in recent if c.get('exercise_done', False))
+        # Totals, risk levels and habit counts in one pass, one risk calculation per check-in
+        total_sleep = total_stress = total_emotional = 0
+        alcohol_days = exercise_days = 0
+        level_counts = Counter()
+        for c in recent:
+            total_sleep += c.get('sleep_hours', 0)
+            total_stress += c.get('stress_level', 0)
+            total_emotional += c.get('emotional_state', 0)
+            if c.get('alcohol_consumed', False):
+                alcohol_days += 1
+            if c.get('exercise_done', False):
+                exercise_days += 1
+            level_counts[self.calculate_risk_level(c)[0]] += 1
+        
+        avg_sleep = total_sleep / len(recent)
         
         return {
             'days_analyzed': len(recent),
             'avg_sleep': round(avg_sleep, 1),
-            'avg_stress': round(avg_stress, 1),
-            'avg_emotional': round(avg_emotional, 1),
-            'red_days': red_days,
-            'yellow_days': yellow_days,
-            'green_days': green_days,
+            'avg_stress': round(total_stress / len(recent), 1),
+            'avg_emotional': round(total_emotional / len(recent), 1),
+            'red_days': level_counts['RED'],
+            'yellow_days': level_counts['YELLOW'],
+            'green_days': level_counts['GREEN'],
             'alcohol_days': alcohol_days,
             'exercise_days': exercise_days,
             'sleep_trend': 'improving' if len(recent) > 1 and recent[-1].get('sleep_hours', 0) > avg_sleep else 'declining'
@@ -282,11 +338,12 @@ class PsychologicalManager:
                 else:
                     st.error("❌ Error saving check-in")
     
-    def show_clearance_dashboard(self):
-        """Display current trading clearance status."""
+    def show_clearance_dashboard(self, clearance: Optional[Dict] = None):
+        """Display current trading clearance status (computed here unless passed in)."""
         st.header("🚦 Trading Clearance Status")
         
-        clearance = self.get_trading_clearance()
+        if clearance is None:
+            clearance = self.get_trading_clearance()
         
         # Status card
         status_color = clearance['color']
@@ -378,22 +435,17 @@ class PsychologicalManager:
         """Show historical check-ins and patterns."""
         st.header("📅 Check-In History")
         
-        checkins = self.data_storage.load_data('psychological_checkins')
+        # Frame built once per check-ins file version
+        df = self.data_storage.load_frame('psychological_checkins')
         
-        if not checkins:
+        if df.empty:
             st.info("No check-in history yet.")
             return
         
-        # Convert to dataframe
-        df = pd.DataFrame(checkins)
         df['date'] = pd.to_datetime(df['date'])
         df = df.sort_values('date', ascending=False)
         
-        # Add risk level column
-        df['risk_level'] = df.apply(
-            lambda row: self.calculate_risk_level(row.to_dict())[0],
-            axis=1
-        )
+        df['risk_level'] = self.risk_levels(df)
         
         # Display
         st.dataframe(
@@ -1,6 +1,12 @@
 import streamlit as st
 from typing import Dict, List
 
+from grade_display import GRADE_EMOJI, COND_EMOJI
+
+# Grades a condition can unlock, in selectbox order, with option -> index map
+UNLOCK_GRADES = ("C", "B", "A")
+_UNLOCK_INDEX = {g: i for i, g in enumerate(UNLOCK_GRADES)}
+
 class SettingsManager:
     def __init__(self, data_storage):
         self.data_storage = data_storage
@@ -20,7 +26,8 @@ class SettingsManager:
     def manage_financial_settings(self):
         st.subheader("Financial Goals & Debt")
         
-        settings = self.data_storage.load_settings()
+        # Read-only view for display; a copy is taken only to save
+        settings = self.data_storage.settings
         
         with st.form("financial_settings"):
             col1, col2 = st.columns(2)
@@ -37,40 +44,45 @@ class SettingsManager:
                                              value=float(settings.get('goal_amount', 1000000)), step=10000.0)
             
             if st.form_submit_button("Save", type="primary"):
+                settings = self.data_storage.load_settings()
                 settings['debt_name'] = debt_name
                 settings['debt_amount'] = debt_amount
                 settings['goal_amount'] = goal_amount
+                # The status below reads this same dict, so no rerun is needed to show the change
                 self.data_storage.save_settings(settings)
                 st.success("Saved!")
-                st.rerun()
         
         # Current status
         st.markdown("---")
-        withdrawals = self.data_storage.load_withdrawals()
+        withdrawals = self.data_storage.read_data('withdrawals')
+        
+        # Paid totals in one pass - handle both old and new allocation format
+        debt_paid = 0
+        total_withdrawn = 0
+        for w in withdrawals:
+            if w.get('status') != 'paid':
+                continue
+            amount = w['amount']
+            total_withdrawn += amount
+            if 'allocations' in w:
+                debt_paid += w['allocations'].get('debt', 0)
+            elif w.get('allocation') == 'Debt Payment':
+                debt_paid += amount
         
         col1, col2 = st.columns(2)
         with col1:
-            # Handle both old and new format
-            debt_paid = 0
-            for w in withdrawals:
-                if w.get('status') != 'paid':
-                    continue
-                if 'allocations' in w:
-                    debt_paid += w['allocations'].get('debt', 0)
-                elif w.get('allocation') == 'Debt Payment':
-                    debt_paid += w.get('amount', 0)
-            
             remaining = max(0, settings.get('debt_amount', 5000) - debt_paid)
             st.metric(f"{settings.get('debt_name', 'Debt')} Left", f"${remaining:,.2f}")
             if settings.get('debt_amount', 0) > 0:
-                st.progress(min(debt_paid / settings['debt_amount'], 1.0))
+                frac = debt_paid / settings['debt_amount']
+                st.progress(frac if frac < 1.0 else 1.0)
         
         with col2:
-            total_withdrawn = sum(w['amount'] for w in withdrawals if w.get('status') == 'paid')
             goal = settings.get('goal_amount', 1000000)
             st.metric("Goal Progress", f"${total_withdrawn:,.2f} / ${goal:,.0f}")
             if goal > 0:
-                st.progress(min(total_withdrawn / goal, 1.0))
+                frac = total_withdrawn / goal
+                st.progress(frac if frac < 1.0 else 1.0)
     
     def manage_grade_rules(self):
         st.subheader("Trade Grading Rules")
@@ -127,13 +139,13 @@ class SettingsManager:
                 col1, col2, col3 = st.columns([5, 2, 1])
                 
                 with col1:
-                    grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠"}.get(cond.get('unlocks', 'C'), "⚪")
+                    grade_emoji = COND_EMOJI.get(cond.get('unlocks', 'C'), "⚪")
                     st.write(f"{grade_emoji} {cond['condition']}")
                 
                 with col2:
                     current = cond.get('unlocks', 'C')
-                    new_grade = st.selectbox("Grade", ["C", "B", "A"], 
-                                            index=["C", "B", "A"].index(current),
+                    new_grade = st.selectbox("Grade", UNLOCK_GRADES, 
+                                            index=_UNLOCK_INDEX.get(current, 0),
                                             key=f"grade_{i}", label_visibility="collapsed")
                     if new_grade != current:
                         conditions[i]['unlocks'] = new_grade
@@ -155,7 +167,7 @@ class SettingsManager:
             with col1:
                 new_cond = st.text_input("Condition", placeholder="e.g., Clean FVG entry", label_visibility="collapsed")
             with col2:
-                new_grade = st.selectbox("Unlocks", ["C", "B", "A"], label_visibility="collapsed")
+                new_grade = st.selectbox("Unlocks", UNLOCK_GRADES, label_visibility="collapsed")
             
             if st.form_submit_button("➕ Add Condition", use_container_width=True):
                 if new_cond.strip():
@@ -238,7 +250,7 @@ class SettingsManager:
             for col, grade, dd in [(col1, "A", a_dd), (col2, "B", b_dd), (col3, "C", c_dd), (col4, "F", 0)]:
                 dollars = dd_limit * dd / 100
                 contracts = int(dollars / risk_per)
-                emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}[grade]
+                emoji = GRADE_EMOJI[grade]
                 with col:
                     if grade == "F":
                         st.error(f"{emoji} F\n$0\n**0 contracts**")
@@ -1,9 +1,23 @@
 import streamlit as st
 import pandas as pd
 from datetime import date, datetime, timedelta
+from heapq import nlargest
 from typing import Dict, List
 import calendar
 
+from grade_display import GRADE_EMOJI
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _daily_pnl(_data_storage, data_dir: str, version) -> Dict[str, float]:
+    """Net P&L per trading day (YYYY-MM-DD), one groupby per trades file version."""
+    df = _data_storage.load_trades_frame()
+    if df.empty or 'date' not in df:
+        return {}
+    pnl = df['pnl_net'].fillna(0) if 'pnl_net' in df else pd.Series(0, index=df.index)
+    day = df['date'].fillna('').astype(str).str[:10]
+    traded = day != ''
+    return pnl[traded].groupby(day[traded]).sum().to_dict()
+
 class TradeJournal:
     def __init__(self, data_storage):
         self.data_storage = data_storage
@@ -34,16 +48,13 @@ class TradeJournal:
             selected_year = st.selectbox("Year", range(current_year - 2, current_year + 2),
                                         index=2)
         
-        # Load data
-        trades = self.data_storage.load_trades()
-        daily_entries = self.data_storage.load_daily_entries()
+        # Load data - read-only views, this tab never edits them
+        trades = self.data_storage.read_data('trades')
+        daily_entries = self.data_storage.read_data('daily_entries')
         
         # Calculate daily P&L
-        daily_pnl = {}
-        for trade in trades:
-            trade_date = trade.get('date', '')[:10]
-            if trade_date:
-                daily_pnl[trade_date] = daily_pnl.get(trade_date, 0) + trade.get('pnl_net', 0)
+        daily_pnl = _daily_pnl(self.data_storage, self.data_storage.data_dir,
+                               self.data_storage.file_version('trades'))
         
         # Build calendar
         cal = calendar.Calendar(firstweekday=6)  # Start on Sunday
@@ -92,8 +103,9 @@ class TradeJournal:
         if month_trades:
             col1, col2, col3, col4 = st.columns(4)
             
-            total_pnl = sum(t.get('pnl_net', 0) for t in month_trades)
-            wins = sum(1 for t in month_trades if t.get('pnl_net', 0) > 0)
+            pnls = [t.get('pnl_net', 0) for t in month_trades]
+            total_pnl = sum(pnls)
+            wins = len([p for p in pnls if p > 0])
             win_rate = (wins / len(month_trades) * 100) if month_trades else 0
             
             trading_days = len(set(t.get('date', '')[:10] for t in month_trades))
@@ -114,7 +126,7 @@ class TradeJournal:
         selected_date = st.date_input("Select Date", value=date.today())
         date_str = selected_date.isoformat()
         
-        day_trades = [t for t in trades if t.get('date', '')[:10] == date_str]
+        day_trades = self.data_storage.get_trades_by_date(date_str)
         day_entry = next((e for e in daily_entries if e.get('date') == date_str), None)
         
         col1, col2 = st.columns(2)
@@ -137,7 +149,7 @@ class TradeJournal:
             st.write("**Trades:**")
             for t in day_trades:
                 grade = t.get('grade', '-')
-                grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}.get(grade, "⚪")
+                grade_emoji = GRADE_EMOJI.get(grade, "⚪")
                 pnl = t.get('pnl_net', 0)
                 st.write(f"{grade_emoji} {t.get('symbol', '?')} {t.get('direction', '?')} - ${pnl:+,.2f}")
     
@@ -226,6 +238,7 @@ class TradeJournal:
         
         # Save button
         if st.button("💾 Save Entry", type="primary"):
+            now_iso = datetime.now().isoformat()
             entry_data = {
                 "date": date_str,
                 "sleep_quality": sleep_quality,
@@ -239,14 +252,14 @@ class TradeJournal:
                 "emotional_control": emotional_control,
                 "mistakes": mistakes,
                 "tomorrow": tomorrow,
-                "updated_at": datetime.now().isoformat()
+                "updated_at": now_iso
             }
             
             if existing_idx is not None:
                 daily_entries[existing_idx] = entry_data
             else:
-                entry_data['id'] = len(daily_entries) + 1
-                entry_data['created_at'] = datetime.now().isoformat()
+                entry_data['id'] = self.data_storage.next_id('daily_entries')
+                entry_data['created_at'] = now_iso
                 daily_entries.append(entry_data)
             
             self.data_storage.save_daily_entries(daily_entries)
@@ -254,8 +267,7 @@ class TradeJournal:
             st.rerun()
         
         # Show today's trades
-        trades = self.data_storage.load_trades()
-        day_trades = [t for t in trades if t.get('date', '')[:10] == date_str]
+        day_trades = self.data_storage.get_trades_by_date(date_str)
         
         if day_trades:
             st.markdown("---")
@@ -266,30 +278,32 @@ class TradeJournal:
             
             for t in day_trades:
                 grade = t.get('grade', '-')
-                grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}.get(grade, "⚪")
+                grade_emoji = GRADE_EMOJI.get(grade, "⚪")
                 st.write(f"{grade_emoji} {t.get('symbol')} {t.get('direction')} | ${t.get('pnl_net', 0):+,.2f} | Emotional: {t.get('emotional_state', '-')}")
     
     def show_trade_history(self):
         st.subheader("Trade History")
         st.info("💡 Use **Live Trade Grader** in sidebar to log new trades")
         
-        trades = self.data_storage.load_trades()
+        trades = self.data_storage.read_data('trades')
         
         if not trades:
             st.write("No trades yet")
             return
         
-        # Summary
+        # Summary - one P&L list shared by every metric
+        pnls = [t.get('pnl_net', 0) for t in trades]
+        total_pnl = sum(pnls)
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("Total Trades", len(trades))
-        col2.metric("Win Rate", f"{sum(1 for t in trades if t.get('pnl_net', 0) > 0) / len(trades) * 100:.1f}%")
-        col3.metric("Total P&L", f"${sum(t.get('pnl_net', 0) for t in trades):,.2f}")
-        col4.metric("Avg P&L", f"${sum(t.get('pnl_net', 0) for t in trades) / len(trades):,.2f}")
+        col2.metric("Win Rate", f"{len([p for p in pnls if p > 0]) / len(trades) * 100:.1f}%")
+        col3.metric("Total P&L", f"${total_pnl:,.2f}")
+        col4.metric("Avg P&L", f"${total_pnl / len(trades):,.2f}")
         
         # Trade list
-        for t in sorted(trades, key=lambda x: x.get('date', ''), reverse=True)[:20]:
+        for t in nlargest(20, trades, key=lambda x: x.get('date', '')):
             grade = t.get('grade', '-')
-            grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}.get(grade, "⚪")
+            grade_emoji = GRADE_EMOJI.get(grade, "⚪")
             pnl = t.get('pnl_net', 0)
             
             with st.expander(f"{t.get('date', 'N/A')} | {grade_emoji} | {t.get('symbol', '?')} {t.get('direction', '?')} | ${pnl:+,.2f}"):
@@ -315,11 +329,12 @@ class TradeJournal:
             st.write("No trades to edit")
             return
         
-        for i, t in enumerate(sorted(trades, key=lambda x: x.get('date', ''), reverse=True)[:15]):
-            original_idx = next((j for j, tr in enumerate(trades) if tr.get('id') == t.get('id')), i)
+        # Latest 15 by date, as positions into trades so edits need no id lookup
+        for original_idx in nlargest(15, range(len(trades)), key=lambda j: trades[j].get('date', '')):
+            t = trades[original_idx]
             
             grade = t.get('grade', '-')
-            grade_emoji = {"A": "🟢", "B": "🟡", "C": "🟠", "F": "🔴"}.get(grade, "⚪")
+            grade_emoji = GRADE_EMOJI.get(grade, "⚪")
             
             with st.expander(f"✏️ {t.get('date', 'N/A')} | {grade_emoji} | ${t.get('pnl_net', 0):+,.2f}"):
                 col1, col2 = st.columns(2)